@@ -11,22 +11,14 @@ NO CORE CODE MODIFICATIONS REQUIRED - this is the key demonstration
 of extensibility through clean architecture.
 """
 
-from src.mcp.server import MCPServer
-from src.mcp.tools.calculator_tool import CalculatorTool
-from src.mcp.tools.echo_tool import EchoTool
-from src.mcp.tools.batch_processor_tool import BatchProcessorTool
-from src.mcp.tools.concurrent_fetcher_tool import ConcurrentFetcherTool
-from src.mcp.resources.config_resource import ConfigResource
-from src.mcp.resources.status_resource import StatusResource
-from src.mcp.prompts.code_review_prompt import CodeReviewPrompt
-from src.mcp.prompts.summarize_prompt import SummarizePrompt
-
-# PLUGIN: Import external plugin (not part of core MCP)
-from examples.plugins.weather_plugin import WeatherTool
-
 
 def main():
     """Demonstrate MCP server with external plugin."""
+    from src.mcp.factories import build_default_server
+
+    # PLUGIN: Import external plugin (not part of core MCP)
+    from examples.plugins.weather_plugin import WeatherTool
+
     print("=" * 70)
     print("MCP Plugin Demo - System Extensibility")
     print("=" * 70)
@@ -39,24 +31,11 @@ def main():
 
     # Initialize MCP server
     print("1. Initializing MCP Server...")
-    server = MCPServer()
-
     # Register built-in tools + external plugin
     # NOTE: WeatherTool is treated exactly like built-in tools!
     # This demonstrates the Open/Closed Principle in action.
-    server.initialize(
-        tools=[
-            # Built-in tools
-            CalculatorTool(),
-            EchoTool(),
-            BatchProcessorTool(),
-            ConcurrentFetcherTool(),
-            # PLUGIN: External tool (no core code changes needed!)
-            WeatherTool()
-        ],
-        resources=[ConfigResource(), StatusResource()],
-        prompts=[CodeReviewPrompt(), SummarizePrompt()]
-    )
+    # PLUGIN: External tool (no core code changes needed!)
+    server = build_default_server(extra_tools=[WeatherTool()])
     print("   ✓ Server initialized with built-in tools + weather plugin")
     print()
 
@@ -38,13 +38,23 @@ USAGE:
 """
 
 from typing import Any, Dict
-import random
-from datetime import datetime
+import zlib
+from datetime import datetime, timezone
 
 from src.mcp.tools.base_tool import BaseTool
 from src.mcp.schemas.tool_schemas import ToolSchema
 from src.core.errors.exceptions import ValidationError
 
+# Simulated weather conditions
+_CONDITIONS = (
+    'Sunny',
+    'Partly Cloudy',
+    'Cloudy',
+    'Rainy',
+    'Clear',
+    'Overcast'
+)
+
 
 class WeatherTool(BaseTool):
     """
@@ -162,8 +172,8 @@ class WeatherTool(BaseTool):
         - Cache results to avoid excessive API calls
         - Validate API responses
         
-        For this demo, we simulate data based on city name hash
-        to keep it deterministic and require no external dependencies.
+        For this demo, we derive data arithmetically from a hash of the
+        city name to keep it deterministic and require no external dependencies.
         
         Args:
             city: City name
@@ -172,31 +182,22 @@ class WeatherTool(BaseTool):
         Returns:
             Simulated weather data
         """
-        # Use city name to seed random (deterministic for same city)
-        seed = sum(ord(c) for c in city.lower())
-        random.seed(seed)
+        # Derive all values from the city name (deterministic for same city)
+        seed = zlib.crc32(city.encode('utf-8').lower())
+
+        # Generate simulated temperature (10-30 °C)
+        base_temp_celsius = 10 + seed % 21
 
-        # Generate simulated temperature
-        base_temp_celsius = random.randint(10, 30)
-        
         if units == 'fahrenheit':
             temperature = (base_temp_celsius * 9/5) + 32
         else:
             temperature = base_temp_celsius
 
-        # Simulated weather conditions
-        conditions = [
-            'Sunny',
-            'Partly Cloudy',
-            'Cloudy',
-            'Rainy',
-            'Clear',
-            'Overcast'
-        ]
-        condition = random.choice(conditions)
+        # Simulated weather condition
+        condition = _CONDITIONS[(seed >> 3) % len(_CONDITIONS)]
 
-        # Simulated humidity
-        humidity = random.randint(30, 90)
+        # Simulated humidity (30-90 %)
+        humidity = 30 + (seed >> 8) % 61
 
         return {
             'city': city,
@@ -204,7 +205,7 @@ class WeatherTool(BaseTool):
             'units': units,
             'condition': condition,
             'humidity': humidity,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
             'note': 'Simulated data for demo purposes'
         }
 
@@ -10,21 +10,11 @@ This example demonstrates:
 5. Executing concurrent_fetcher (multithreading)
 """
 
-from src.sdk.mcp_client import MCPClient
-from src.mcp.server import MCPServer
-from src.mcp.tools.calculator_tool import CalculatorTool
-from src.mcp.tools.echo_tool import EchoTool
-from src.mcp.tools.batch_processor_tool import BatchProcessorTool
-from src.mcp.tools.concurrent_fetcher_tool import ConcurrentFetcherTool
-from src.mcp.resources.config_resource import ConfigResource
-from src.mcp.resources.status_resource import StatusResource
-from src.mcp.prompts.code_review_prompt import CodeReviewPrompt
-from src.mcp.prompts.summarize_prompt import SummarizePrompt
-import json
-
 
 def main():
     """Run SDK demo."""
+    from src.mcp.factories import build_default_server
+
     print("=" * 60)
     print("MCP SDK Demo")
     print("=" * 60)
@@ -32,17 +22,7 @@ def main():
 
     # Step 1: Initialize MCP server
     print("1. Initializing MCP Server...")
-    server = MCPServer()
-    server.initialize(
-        tools=[
-            CalculatorTool(),
-            EchoTool(),
-            BatchProcessorTool(),
-            ConcurrentFetcherTool()
-        ],
-        resources=[ConfigResource(), StatusResource()],
-        prompts=[CodeReviewPrompt(), SummarizePrompt()]
-    )
+    server = build_default_server()
     print("   ✓ Server initialized")
     print()
 
@@ -26,34 +26,21 @@ import os
 if 'APP_ENV' not in os.environ:
     os.environ['APP_ENV'] = 'server'
 
-from src.mcp.server import MCPServer
-from src.mcp.tools.calculator_tool import CalculatorTool
-from src.mcp.tools.echo_tool import EchoTool
-from src.mcp.tools.batch_processor_tool import BatchProcessorTool
-from src.mcp.tools.concurrent_fetcher_tool import ConcurrentFetcherTool
-from src.mcp.resources.config_resource import ConfigResource
-from src.mcp.resources.status_resource import StatusResource
-from src.mcp.prompts.code_review_prompt import CodeReviewPrompt
-from src.mcp.prompts.summarize_prompt import SummarizePrompt
-from src.transport.stdio_transport import STDIOTransport
-from src.transport.transport_handler import TransportHandler
-from src.core.logging.logger import Logger
-
 
 def main():
     """Run the MCP server with STDIO transport."""
+    # Imported here so APP_ENV is in place before any module reads config
+    from src.mcp.factories import build_default_server
+    from src.transport.stdio_transport import STDIOTransport
+    from src.transport.transport_handler import TransportHandler
+    from src.core.logging.logger import Logger
+
     logger = Logger.get_logger("ServerRunner")
 
     try:
         # Initialize MCP server
         logger.info("Initializing MCP server...")
-        server = MCPServer()
-
-        server.initialize(
-            tools=[CalculatorTool(), EchoTool(), BatchProcessorTool(), ConcurrentFetcherTool()],
-            resources=[ConfigResource(), StatusResource()],
-            prompts=[CodeReviewPrompt(), SummarizePrompt()]
-        )
+        server = build_default_server()
 
         # Create transport and handler
         logger.info("Starting STDIO transport...")
@@ -7,7 +7,7 @@ Provides foundational services for the entire application:
 - Error handling and custom exceptions
 """
 
-from src.core.config.config_manager import ConfigManager
+from src.core.config.config_manager import ConfigManager, get_config_manager
 from src.core.logging.logger import Logger
 from src.core.errors.exceptions import (
     BaseApplicationError,
@@ -21,6 +21,7 @@ from src.core.errors.error_handler import ErrorHandler
 
 __all__ = [
     "ConfigManager",
+    "get_config_manager",
     "Logger",
     "ErrorHandler",
     "BaseApplicationError",
@@ -1,12 +1,181 @@
 """
 Configuration Manager for the application.
 Handles loading and accessing configuration values from YAML files.
+
+Configuration is loaded once at import time into module-level state and
+served through the module functions ``get``, ``get_all`` and ``reload``.
+``ConfigManager`` is kept as a thin facade over those functions; use
+``get_config_manager()`` to obtain the shared instance.
 """
 
+import copy
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
-import yaml
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+from yaml import load as _yaml_load
+
+try:
+    # libyaml-backed loader when PyYAML was built with the C extension
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _Loader
+
+
+# Configuration directory (the project root is the parent of src)
+_CONFIG_DIR = Path(__file__).resolve().parents[3] / 'config'
+
+# Merged configuration tree and its dotted-path index
+_config: Dict[str, Any] = {}
+_flat: Dict[str, Any] = {}
+_view: Mapping[str, Any] = MappingProxyType(_config)
+
+# Parsed YAML documents keyed by path, tagged with the file's mtime
+_PARSE_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+# Called after every reload so caches built from configuration are dropped
+_RELOAD_CALLBACKS: List[Callable[[], None]] = []
+
+
+def _get_config_directory() -> Path:
+    """Get the configuration directory path."""
+    return _CONFIG_DIR
+
+
+def _deep_update(base: dict, update: dict) -> None:
+    """Merge nested dictionaries in place, using an explicit stack."""
+    stack = [(base, update)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if type(value) is dict and type(current) is dict:
+                stack.append((current, value))
+            else:
+                target[key] = value
+
+
+def _flatten(config: dict, prefix: str = '') -> Dict[str, Any]:
+    """Flatten nested dictionaries into a dict keyed by dotted path."""
+    flat: Dict[str, Any] = {}
+    for key, value in config.items():
+        path = f'{prefix}{key}'
+        flat[path] = value
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f'{path}.'))
+    return flat
+
+
+def _load_yaml(path: Path) -> Dict[str, Any]:
+    """
+    Load a YAML file, reusing the parsed document while the file is unchanged.
+
+    Args:
+        path: Path of the YAML file
+
+    Returns:
+        Parsed document (a private copy, safe to merge into)
+    """
+    key = str(path)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _PARSE_CACHE.get(key)
+    if cached is None or cached[0] != mtime:
+        with open(path, 'rb') as f:
+            cached = (mtime, _yaml_load(f, Loader=_Loader) or {})
+        _PARSE_CACHE[key] = cached
+    return copy.deepcopy(cached[1])
+
+
+def _load_config() -> Dict[str, Any]:
+    """
+    Load configuration from YAML files.
+
+    Returns:
+        Merged configuration (base, environment, local overrides)
+    """
+    config_dir = _get_config_directory()
+    environment = os.getenv('APP_ENV', 'development')
+
+    # Base configuration, environment-specific configuration and
+    # local overrides (not in git), in increasing precedence
+    paths = [
+        path for path in (
+            config_dir / 'base.yaml',
+            config_dir / f'{environment}.yaml',
+            config_dir / 'local.yaml',
+        )
+        if path.exists()
+    ]
+
+    # Read files concurrently; file I/O releases the GIL
+    if len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            documents = list(executor.map(_load_yaml, paths))
+    else:
+        documents = [_load_yaml(path) for path in paths]
+
+    config: Dict[str, Any] = {}
+    for document in documents:
+        _deep_update(config, document)
+
+    return config
+
+
+def get(key: str, default: Any = None) -> Any:
+    """
+    Get a configuration value by key.
+
+    Supports nested keys using dot notation (e.g., 'database.host').
+
+    Args:
+        key: Configuration key (supports dot notation)
+        default: Default value if key not found
+
+    Returns:
+        Configuration value or default
+    """
+    return _flat.get(key, default)
+
+
+def get_all() -> Mapping[str, Any]:
+    """
+    Get all configuration values.
+
+    Returns:
+        Read-only view of the complete configuration (use ``dict()`` on
+        it when a mutable copy is needed)
+    """
+    return _view
+
+
+def on_reload(callback: Callable[[], None]) -> Callable[[], None]:
+    """
+    Register a callback to run after each configuration reload.
+
+    Args:
+        callback: Function taking no arguments, typically a cache_clear
+
+    Returns:
+        The callback, so this can be used as a decorator
+    """
+    _RELOAD_CALLBACKS.append(callback)
+    return callback
+
+
+def reload() -> None:
+    """Reload configuration from files and notify reload callbacks."""
+    global _config, _flat, _view
+    _config = _load_config()
+    _view = MappingProxyType(_config)
+    # Index every dotted path once so get() is a single lookup
+    _flat = _flatten(_config)
+    for callback in _RELOAD_CALLBACKS:
+        callback()
+
+
+reload()
 
 
 class ConfigManager:
@@ -14,71 +183,16 @@ class ConfigManager:
     Manages application configuration from YAML files.
 
     Supports environment-based configuration files and provides
-    a centralized way to access configuration values.
+    a centralized way to access configuration values. All instances
+    share the module-level configuration, so construction is free.
     """
 
-    _instance: Optional['ConfigManager'] = None
-    _config: Dict[str, Any] = {}
-
-    def __new__(cls) -> 'ConfigManager':
-        """Implement singleton pattern."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
-    def __init__(self) -> None:
-        """Initialize the configuration manager."""
-        if not self._config:  # Only load once
-            self._load_config()
-
-    def _load_config(self) -> None:
-        """Load configuration from YAML files."""
-        config_dir = self._get_config_directory()
-        environment = os.getenv('APP_ENV', 'development')
-
-        # Load base configuration
-        base_config_path = config_dir / 'base.yaml'
-        if base_config_path.exists():
-            with open(base_config_path, 'r') as f:
-                self._config = yaml.safe_load(f) or {}
-
-        # Load environment-specific configuration
-        env_config_path = config_dir / f'{environment}.yaml'
-        if env_config_path.exists():
-            with open(env_config_path, 'r') as f:
-                env_config = yaml.safe_load(f) or {}
-                self._deep_update(self._config, env_config)
-
-        # Load local overrides (not in git)
-        local_config_path = config_dir / 'local.yaml'
-        if local_config_path.exists():
-            with open(local_config_path, 'r') as f:
-                local_config = yaml.safe_load(f) or {}
-                self._deep_update(self._config, local_config)
-
-    @staticmethod
-    def _get_config_directory() -> Path:
-        """Get the configuration directory path."""
-        # Get project root (parent of src directory)
-        current_file = Path(__file__)
-        project_root = current_file.parent.parent.parent.parent
-        return project_root / 'config'
-
-    @staticmethod
-    def _deep_update(base: dict, update: dict) -> None:
-        """Recursively update nested dictionaries."""
-        for key, value in update.items():
-            if isinstance(value, dict) and key in base and isinstance(base[key], dict):
-                ConfigManager._deep_update(base[key], value)
-            else:
-                base[key] = value
+    __slots__ = ()
 
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get a configuration value by key.
 
-        Supports nested keys using dot notation (e.g., 'database.host').
-
         Args:
             key: Configuration key (supports dot notation)
             default: Default value if key not found
@@ -86,27 +200,28 @@ class ConfigManager:
         Returns:
             Configuration value or default
         """
-        keys = key.split('.')
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
+        return get(key, default)
 
-        return value
-
-    def get_all(self) -> Dict[str, Any]:
+    def get_all(self) -> Mapping[str, Any]:
         """
         Get all configuration values.
 
         Returns:
-            Complete configuration dictionary
+            Read-only view of the complete configuration
         """
-        return self._config.copy()
+        return get_all()
 
     def reload(self) -> None:
         """Reload configuration from files."""
-        self._config = {}
-        self._load_config()
+        reload()
+
+
+@functools.cache
+def get_config_manager() -> ConfigManager:
+    """
+    Get the shared ConfigManager instance.
+
+    Returns:
+        ConfigManager instance, created on first call
+    """
+    return ConfigManager()
@@ -3,11 +3,11 @@ Error handling utilities for the application.
 Provides centralized error logging and handling mechanisms.
 """
 
-import sys
-import traceback
-from typing import Any, Callable, Dict, Optional, TypeVar, cast
+import functools
+import logging
+from typing import Any, Callable, Dict, NamedTuple, Optional, TypeVar
 
-from src.core.config.config_manager import ConfigManager
+from src.core.config import config_manager as config
 from src.core.logging.logger import Logger
 from src.core.errors.exceptions import BaseApplicationError
 
@@ -15,6 +15,41 @@ from src.core.errors.exceptions import BaseApplicationError
 T = TypeVar('T')
 
 
+class ErrorSettings(NamedTuple):
+    """Error handling flags read from configuration."""
+
+    log_errors: bool
+    raise_on_critical: bool
+    include_traceback: bool
+
+
+def _load_settings() -> ErrorSettings:
+    """
+    Read the error handling flags from configuration.
+
+    Returns:
+        Snapshot of the error handling configuration
+    """
+    return ErrorSettings(
+        log_errors=config.get('error_handling.log_errors', True),
+        raise_on_critical=config.get('error_handling.raise_on_critical', False),
+        include_traceback=config.get('error_handling.include_traceback', True)
+    )
+
+
+# Flags shared by every handler; replaced as a whole after each reload
+_settings = _load_settings()
+
+
+def _reload_settings() -> None:
+    """Rebuild the shared flags after a configuration reload."""
+    global _settings
+    _settings = _load_settings()
+
+
+config.on_reload(_reload_settings)
+
+
 class ErrorHandler:
     """
     Centralized error handling mechanism.
@@ -23,6 +58,8 @@ class ErrorHandler:
     according to application configuration.
     """
 
+    __slots__ = ('logger',)
+
     def __init__(self, logger_name: str = __name__):
         """
         Initialize the error handler.
@@ -31,35 +68,69 @@ class ErrorHandler:
             logger_name: Name for the logger instance
         """
         self.logger = Logger.get_logger(logger_name)
-        self.config = ConfigManager()
 
     def handle_error(
         self,
         error: Exception,
         context: Optional[Dict[str, Any]] = None,
-        reraise: bool = False
+        reraise: bool = False,
+        **context_items: Any
     ) -> None:
         """
         Handle an exception with logging and optional re-raising.
 
+        Context is usually given as keyword arguments, e.g.
+        ``handle_error(e, tool_name=name)``; the keyword dict is used as-is,
+        so callers do not build a dict of their own.
+
         Args:
             error: Exception to handle
-            context: Additional context information
+            context: Additional context information as a dict
             reraise: Whether to re-raise the exception after handling
+            **context_items: Additional context information as keywords
         """
-        context = context or {}
+        if context is None:
+            context = context_items
+        elif context_items:
+            context = {**context, **context_items}
+        settings = _settings
 
         # Check if we should log errors
-        if self.config.get('error_handling.log_errors', True):
+        if settings.log_errors:
             self._log_error(error, context)
 
         # Check if we should raise on critical errors
         if reraise or (
             isinstance(error, BaseApplicationError) and
-            self.config.get('error_handling.raise_on_critical', False)
+            settings.raise_on_critical
         ):
             raise error
 
+    def handle_expected(
+        self,
+        error: BaseApplicationError,
+        **context: Any
+    ) -> None:
+        """
+        Handle an anticipated error such as an unknown name or bad input.
+
+        Logged as a single warning line without traceback or structured
+        payload; the raise-on-critical policy applies as in handle_error.
+
+        Args:
+            error: Application error to handle
+            **context: Additional context information
+        """
+        settings = _settings
+        if settings.log_errors and self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(
+                "%s: %s", type(error).__name__, error.message,
+                extra={'context': context}
+            )
+
+        if settings.raise_on_critical:
+            raise error
+
     def _log_error(self, error: Exception, context: Dict[str, Any]) -> None:
         """
         Log an error with appropriate level and details.
@@ -68,11 +139,6 @@ class ErrorHandler:
             error: Exception to log
             context: Additional context information
         """
-        include_traceback = self.config.get(
-            'error_handling.include_traceback',
-            True
-        )
-
         error_info = {
             'type': type(error).__name__,
             'message': str(error),
@@ -82,10 +148,18 @@ class ErrorHandler:
         if isinstance(error, BaseApplicationError):
             error_info['details'] = error.details
 
-        if include_traceback:
-            error_info['traceback'] = traceback.format_exc()
-
-        self.logger.error(f"Error occurred: {error_info}")
+        # Context is rendered into the message itself, lazily, so every
+        # formatter shows it (application errors already carry their details
+        # in str()); the payload is also attached as a structured ``error``
+        # attribute and the traceback via exc_info
+        self.logger.error(
+            "Error occurred: %s: %s (context: %s)",
+            error_info['type'],
+            error_info['message'],
+            context,
+            extra={'error': error_info},
+            exc_info=error if _settings.include_traceback else None
+        )
 
     @staticmethod
     def safe_execute(
@@ -108,9 +182,23 @@ class ErrorHandler:
         Returns:
             Function result or default value on error
         """
-        handler = ErrorHandler(logger_name)
+        handler = _get_handler(logger_name)
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            handler.handle_error(e, context={'function': func.__name__})
+            handler.handle_error(e, function=func.__name__)
             return default
+
+
+@functools.lru_cache(maxsize=128)
+def _get_handler(logger_name: str) -> ErrorHandler:
+    """
+    Get a shared error handler for the given logger name.
+
+    Args:
+        logger_name: Name for the logger instance
+
+    Returns:
+        Memoized ErrorHandler instance
+    """
+    return ErrorHandler(logger_name)
@@ -23,7 +23,7 @@ class BaseApplicationError(Exception):
         """
         super().__init__(message)
         self.message = message
-        self.details = details or {}
+        self.details = details if details is not None else {}
 
     def __str__(self) -> str:
         """Return string representation of the error."""
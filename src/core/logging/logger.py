@@ -1,15 +1,116 @@
 """
 Logging mechanism for the application.
 Provides centralized logging with file and console handlers.
+
+All loggers share one console handler and one QueueHandler; file output
+is written by a single background listener thread, so callers never block
+on disk I/O.
 """
 
+import atexit
+import functools
 import logging
+import os
+import queue
+import stat
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Dict, Optional
+from typing import List, NamedTuple, Optional, Set, Tuple
+from weakref import WeakKeyDictionary
+
+from src.core.config.config_manager import get_config_manager, on_reload
+
+
+class LogConfig(NamedTuple):
+    """Snapshot of the logging settings."""
+
+    level: int
+    fmt: str
+    console_enabled: bool
+    file_enabled: bool
+    path: str
+    max_bytes: int
+    backup_count: int
+
+
+class FastFormatter(logging.Formatter):
+    """
+    %-style formatter with its per-record checks resolved up front.
+
+    Whether the format uses the timestamp is decided once, and the record
+    is interpolated directly instead of going through the style object.
+    """
 
-from src.core.config.config_manager import ConfigManager
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
+        """
+        Initialize the formatter.
+
+        Args:
+            fmt: %-style format string
+            datefmt: Optional strftime format for asctime
+        """
+        super().__init__(fmt, datefmt)
+        self._compiled = self._style._fmt
+        self._uses_time = self._style.usesTime()
+
+    def usesTime(self) -> bool:
+        """Return whether the format includes asctime."""
+        return self._uses_time
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Interpolate the record attributes into the format string."""
+        return self._compiled % record.__dict__
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler writing UTF-8 bytes to an O_APPEND descriptor.
+
+    Each record is formatted and encoded once and written with unbuffered
+    writes. The rollover check reads the file size with a single fstat on
+    the open descriptor, so growth from other processes or handlers
+    appending to the same file is taken into account.
+    """
+
+    def _open(self):
+        """Open the log file for appending raw bytes."""
+        fd = os.open(
+            self.baseFilename,
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+            0o644
+        )
+        # Never rotate anything other than regular files (bpo-45401)
+        self._regular = stat.S_ISREG(os.fstat(fd).st_mode)
+        return os.fdopen(fd, 'wb', buffering=0)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Write a record, rotating first if it would exceed the size limit.
+
+        Args:
+            record: Log record to write
+        """
+        try:
+            data = (self.format(record) + self.terminator).encode('utf-8')
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._regular:
+                size = os.fstat(self.stream.fileno()).st_size
+                if size and size + len(data) >= self.maxBytes:
+                    self.doRollover()
+                    if self.stream is None:
+                        self.stream = self._open()
+            # Raw writes may be partial; keep going until the record is out
+            fd = self.stream.fileno()
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 class Logger:
@@ -20,7 +121,20 @@ class Logger:
     the application's configuration system.
     """
 
-    _loggers: Dict[str, logging.Logger] = {}
+    # Names of loggers already configured; logging.getLogger caches the objects
+    _configured: Set[str] = set()
+    _configure_lock = threading.Lock()
+
+    # Loggers resolved per class; weak keys so the classes can be collected
+    _class_loggers: 'WeakKeyDictionary[type, logging.Logger]' = WeakKeyDictionary()
+
+    # Handlers attached to every logger, built on first use
+    _shared_handlers: Optional[Tuple[logging.Handler, ...]] = None
+
+    # Shared file queue and the listener draining it into the file handler
+    _file_queue: Optional[queue.SimpleQueue] = None
+    _file_listener: Optional[QueueListener] = None
+    _listener_lock = threading.Lock()
 
     @classmethod
     def get_logger(cls, name: str) -> logging.Logger:
@@ -33,15 +147,95 @@ class Logger:
         Returns:
             Configured logger instance
         """
-        if name in cls._loggers:
-            return cls._loggers[name]
-
         logger = logging.getLogger(name)
-        cls._configure_logger(logger)
-        cls._loggers[name] = logger
+        if name not in cls._configured:
+            with cls._configure_lock:
+                if name not in cls._configured:
+                    cls._configure_logger(logger)
+                    cls._configured.add(name)
 
         return logger
 
+    @classmethod
+    def get_class_logger(cls, owner: type) -> logging.Logger:
+        """
+        Get the logger named after a class, resolved once per class.
+
+        Meant for components created in numbers (tools, resources,
+        prompts), so instantiation skips the logging module lookup.
+
+        Args:
+            owner: Class whose name the logger takes
+
+        Returns:
+            Configured logger instance
+        """
+        logger = cls._class_loggers.get(owner)
+        if logger is None:
+            logger = cls._class_loggers[owner] = cls.get_logger(owner.__name__)
+        return logger
+
+    @staticmethod
+    def get_null_logger(name: str) -> logging.Logger:
+        """
+        Get a logger that discards every record.
+
+        The logger is disabled, so logging calls return after a single
+        level check without building records.
+
+        Args:
+            name: Logger name (typically module name)
+
+        Returns:
+            Silent logger instance
+        """
+        logger = logging.getLogger(f'{name}.null')
+        if not logger.handlers:
+            logger.addHandler(logging.NullHandler())
+            logger.propagate = False
+            logger.disabled = True
+        return logger
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _load_cfg() -> LogConfig:
+        """
+        Read the logging settings once from configuration.
+
+        Returns:
+            Cached logging configuration snapshot
+        """
+        config = get_config_manager()
+        level_str = config.get('logging.level', 'INFO')
+        return LogConfig(
+            level=getattr(logging, level_str.upper(), logging.INFO),
+            fmt=config.get(
+                'logging.format',
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            ),
+            console_enabled=config.get('logging.console.enabled', True),
+            file_enabled=config.get('logging.file.enabled', True),
+            path=config.get('logging.file.path', 'logs/app.log'),
+            max_bytes=config.get('logging.file.max_bytes', 10485760),
+            backup_count=config.get('logging.file.backup_count', 5)
+        )
+
+    @classmethod
+    def invalidate_cfg(cls) -> None:
+        """
+        Drop the cached logging settings after a configuration reload.
+
+        Loggers already configured take the new level at once; their
+        handlers are kept, new settings apply to handlers built later.
+        """
+        with cls._configure_lock:
+            cls._load_cfg.cache_clear()
+            cls._get_formatter.cache_clear()
+            cls._shared_handlers = None
+            level = cls._load_cfg().level
+            for name in cls._configured:
+                logging.getLogger(name).setLevel(level)
+
     @classmethod
     def _configure_logger(cls, logger: logging.Logger) -> None:
         """
@@ -50,83 +244,153 @@ class Logger:
         Args:
             logger: Logger instance to configure
         """
-        config = ConfigManager()
+        cfg = cls._load_cfg()
 
         # Set logging level
-        level_str = config.get('logging.level', 'INFO')
-        level = getattr(logging, level_str.upper(), logging.INFO)
-        logger.setLevel(level)
+        logger.setLevel(cfg.level)
 
         # Avoid duplicate handlers
         if logger.handlers:
             return
 
-        # Get formatter
-        formatter = cls._get_formatter(config)
-
-        # Add console handler if enabled
-        if config.get('logging.console.enabled', True):
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setFormatter(formatter)
-            logger.addHandler(console_handler)
-
-        # Add file handler if enabled
-        if config.get('logging.file.enabled', True):
-            file_handler = cls._get_file_handler(config, formatter)
-            if file_handler:
-                logger.addHandler(file_handler)
+        for handler in cls._get_shared_handlers(cfg):
+            logger.addHandler(handler)
 
         # Prevent propagation to root logger
         logger.propagate = False
 
+    @classmethod
+    def _get_shared_handlers(
+        cls,
+        cfg: LogConfig
+    ) -> Tuple[logging.Handler, ...]:
+        """
+        Get the process-wide handlers, creating them on first use.
+
+        Called with ``_configure_lock`` held.
+
+        Args:
+            cfg: Logging configuration snapshot
+
+        Returns:
+            Console and/or file handlers, as enabled in configuration
+        """
+        if cls._shared_handlers is None:
+            formatter = cls._get_formatter(cfg.fmt)
+            handlers: List[logging.Handler] = []
+
+            # Add console handler if enabled
+            if cfg.console_enabled:
+                console_handler = logging.StreamHandler(sys.stdout)
+                console_handler.setFormatter(formatter)
+                handlers.append(console_handler)
+
+            # Add file handler if enabled
+            if cfg.file_enabled:
+                queue_handler = cls._get_queue_handler(cfg, formatter)
+                if queue_handler:
+                    handlers.append(queue_handler)
+
+            cls._shared_handlers = tuple(handlers)
+
+        return cls._shared_handlers
+
+    @classmethod
+    def _get_queue_handler(
+        cls,
+        cfg: LogConfig,
+        formatter: logging.Formatter
+    ) -> Optional[QueueHandler]:
+        """
+        Create a handler feeding the shared background file writer.
+
+        The rotating file handler and its listener thread are created on
+        first use; every logger enqueues into the same queue.
+
+        Args:
+            cfg: Logging configuration snapshot
+            formatter: Log formatter to use
+
+        Returns:
+            Queue handler or None if the file handler could not be created
+        """
+        with cls._listener_lock:
+            if cls._file_queue is None:
+                file_handler = cls._get_file_handler(cfg, formatter)
+                if file_handler is None:
+                    return None
+
+                cls._file_queue = queue.SimpleQueue()
+                cls._file_listener = QueueListener(
+                    cls._file_queue,
+                    file_handler,
+                    respect_handler_level=True
+                )
+                cls._file_listener.start()
+                atexit.register(cls._stop_file_listener)
+
+        return QueueHandler(cls._file_queue)
+
+    @classmethod
+    def _stop_file_listener(cls) -> None:
+        """Drain pending records and close the file handler."""
+        with cls._listener_lock:
+            listener = cls._file_listener
+            if listener is None:
+                return
+
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
+            cls._file_listener = None
+            cls._file_queue = None
+
     @staticmethod
-    def _get_formatter(config: ConfigManager) -> logging.Formatter:
+    @functools.lru_cache(maxsize=None)
+    def _get_formatter(log_format: str) -> FastFormatter:
         """
-        Create log formatter from configuration.
+        Create log formatter, shared by every logger using the same format.
 
         Args:
-            config: Configuration manager instance
+            log_format: Logging format string
 
         Returns:
             Configured formatter
         """
-        log_format = config.get(
-            'logging.format',
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        return logging.Formatter(log_format)
+        return FastFormatter(log_format)
 
     @staticmethod
     def _get_file_handler(
-        config: ConfigManager,
+        cfg: LogConfig,
         formatter: logging.Formatter
-    ) -> Optional[RotatingFileHandler]:
+    ) -> Optional[FastRotatingFileHandler]:
         """
         Create rotating file handler from configuration.
 
         Args:
-            config: Configuration manager instance
+            cfg: Logging configuration snapshot
             formatter: Log formatter to use
 
         Returns:
             Configured file handler or None if path invalid
         """
-        log_path = config.get('logging.file.path', 'logs/app.log')
-        max_bytes = config.get('logging.file.max_bytes', 10485760)
-        backup_count = config.get('logging.file.backup_count', 5)
-
         # Ensure log directory exists
-        log_file = Path(log_path)
+        log_file = Path(cfg.path)
         log_file.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            handler = RotatingFileHandler(
-                log_path,
-                maxBytes=max_bytes,
-                backupCount=backup_count
+            handler = FastRotatingFileHandler(
+                cfg.path,
+                maxBytes=cfg.max_bytes,
+                backupCount=cfg.backup_count
             )
             handler.setFormatter(formatter)
             return handler
         except (OSError, ValueError) as e:
             print(f"Warning: Could not create file handler: {e}")
             return None
+
+
+# Configuration reloads drop the cached logging settings
+on_reload(Logger.invalidate_cfg)
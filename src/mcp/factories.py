@@ -0,0 +1,66 @@
+"""
+MCP Server Factories.
+
+Builds the canonical set of tools, resources and prompts shared by the
+server runner and the example scripts. The component tuples are cached,
+so schema construction happens once per process.
+"""
+
+import functools
+from typing import Iterable, Tuple
+
+from src.mcp.server import MCPServer
+from src.mcp.tools.base_tool import BaseTool
+from src.mcp.tools.calculator_tool import CalculatorTool
+from src.mcp.tools.echo_tool import EchoTool
+from src.mcp.tools.batch_processor_tool import BatchProcessorTool
+from src.mcp.tools.concurrent_fetcher_tool import ConcurrentFetcherTool
+from src.mcp.resources.base_resource import BaseResource
+from src.mcp.resources.config_resource import ConfigResource
+from src.mcp.resources.status_resource import StatusResource
+from src.mcp.prompts.base_prompt import BasePrompt
+from src.mcp.prompts.code_review_prompt import CodeReviewPrompt
+from src.mcp.prompts.summarize_prompt import SummarizePrompt
+
+
+@functools.cache
+def default_tools() -> Tuple[BaseTool, ...]:
+    """Get the built-in tools."""
+    return (
+        CalculatorTool(),
+        EchoTool(),
+        BatchProcessorTool(),
+        ConcurrentFetcherTool()
+    )
+
+
+@functools.cache
+def default_resources() -> Tuple[BaseResource, ...]:
+    """Get the built-in resources."""
+    return (ConfigResource(), StatusResource())
+
+
+@functools.cache
+def default_prompts() -> Tuple[BasePrompt, ...]:
+    """Get the built-in prompts."""
+    return (CodeReviewPrompt(), SummarizePrompt())
+
+
+def build_default_server(extra_tools: Iterable[BaseTool] = ()) -> MCPServer:
+    """
+    Create and initialize a server with the built-in components.
+
+    Args:
+        extra_tools: Additional tools (e.g. plugins) to register alongside
+            the built-in ones
+
+    Returns:
+        Initialized MCPServer instance
+    """
+    server = MCPServer()
+    server.initialize(
+        tools=[*default_tools(), *extra_tools],
+        resources=list(default_resources()),
+        prompts=list(default_prompts())
+    )
+    return server
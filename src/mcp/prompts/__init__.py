@@ -3,8 +3,28 @@ MCP Prompts package.
 Contains base prompt abstraction and concrete prompt implementations.
 """
 
+import importlib
+from typing import Any
+
 from src.mcp.prompts.base_prompt import BasePrompt
-from src.mcp.prompts.code_review_prompt import CodeReviewPrompt
-from src.mcp.prompts.summarize_prompt import SummarizePrompt
+
+# Concrete implementations are imported on first attribute access (PEP 562)
+_LAZY = {
+    'CodeReviewPrompt': 'src.mcp.prompts.code_review_prompt',
+    'SummarizePrompt': 'src.mcp.prompts.summarize_prompt',
+}
 
 __all__ = ['BasePrompt', 'CodeReviewPrompt', 'SummarizePrompt']
+
+
+def __getattr__(name: str) -> Any:
+    """Import a concrete implementation on first access."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
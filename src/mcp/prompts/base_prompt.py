@@ -3,22 +3,47 @@ Base abstraction for MCP Prompts.
 Prompts are templates for guiding model interactions.
 """
 
-from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Protocol
 
 from src.core.logging.logger import Logger
 from src.core.errors.error_handler import ErrorHandler
 from src.core.errors.exceptions import ValidationError
 
 
-class BasePrompt(ABC):
+class PromptProtocol(Protocol):
+    """Static interface satisfied by every MCP prompt."""
+
+    name: str
+    description: str
+
+    def get_messages(self, arguments: Optional[Dict[str, Any]] = None) -> List[Dict[str, str]]:
+        """Generate prompt messages with given arguments."""
+        ...
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert prompt to dictionary representation."""
+        ...
+
+
+class BasePrompt:
     """
-    Abstract base class for all MCP prompts.
+    Base class for all MCP prompts.
 
     Prompts provide template-based guidance for model interactions.
-    All concrete prompts must inherit from this class.
+    All concrete prompts must inherit from this class and implement
+    get_messages (see PromptProtocol for the interface).
     """
 
+    __slots__ = (
+        'name',
+        'description',
+        'arguments',
+        '_required',
+        '_metadata',
+        'logger',
+        'error_handler'
+    )
+
     def __init__(
         self,
         name: str,
@@ -36,10 +61,20 @@ class BasePrompt(ABC):
         self.name = name
         self.description = description
         self.arguments = arguments or []
-        self.logger = Logger.get_logger(self.__class__.__name__)
+        # Arguments never change after construction; index the required ones
+        self._required = frozenset(
+            arg_def['name'] for arg_def in self.arguments
+            if arg_def.get('required', False)
+        )
+        # Metadata is fixed once the prompt exists; build it once
+        self._metadata = {
+            'name': self.name,
+            'description': self.description,
+            'arguments': self.arguments
+        }
+        self.logger = Logger.get_class_logger(type(self))
         self.error_handler = ErrorHandler(self.__class__.__name__)
 
-    @abstractmethod
     def get_messages(self, arguments: Optional[Dict[str, Any]] = None) -> List[Dict[str, str]]:
         """
         Generate prompt messages with given arguments.
@@ -54,8 +89,11 @@ class BasePrompt(ABC):
 
         Raises:
             ValidationError: If required arguments are missing
+            NotImplementedError: If not overridden by the concrete prompt
         """
-        pass
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement get_messages()"
+        )
 
     def validate_arguments(self, arguments: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -70,17 +108,18 @@ class BasePrompt(ABC):
         Raises:
             ValidationError: If validation fails
         """
-        arguments = arguments or {}
-
         # Check required arguments
-        for arg_def in self.arguments:
-            if arg_def.get('required', False):
-                arg_name = arg_def['name']
-                if arg_name not in arguments:
-                    raise ValidationError(
-                        f"Required argument '{arg_name}' is missing",
-                        {'prompt': self.name, 'missing_argument': arg_name}
-                    )
+        missing = self._required.difference(arguments or ())
+        if missing:
+            # Report the first missing argument in definition order
+            arg_name = next(
+                arg_def['name'] for arg_def in self.arguments
+                if arg_def['name'] in missing
+            )
+            raise ValidationError(
+                f"Required argument '{arg_name}' is missing",
+                {'prompt': self.name, 'missing_argument': arg_name}
+            )
 
         return True
 
@@ -91,11 +130,7 @@ class BasePrompt(ABC):
         Returns:
             Dictionary containing prompt metadata
         """
-        return {
-            'name': self.name,
-            'description': self.description,
-            'arguments': self.arguments
-        }
+        return self._metadata.copy()
 
     def to_dict(self) -> Dict[str, Any]:
         """
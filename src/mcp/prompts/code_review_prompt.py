@@ -3,6 +3,7 @@ Code Review Prompt - Example prompt template.
 Provides guidance for code review tasks.
 """
 
+from collections import ChainMap
 from typing import Any, Dict, List, Optional
 
 from src.mcp.prompts.base_prompt import BasePrompt
@@ -20,6 +21,18 @@ class CodeReviewPrompt(BasePrompt):
     Note: This is an illustrative example demonstrating architecture.
     """
 
+    __slots__ = ()
+
+    _DEFAULTS = {'language': 'unknown', 'focus': 'general best practices'}
+
+    _SYSTEM_TMPL = (
+        "You are an expert code reviewer. "
+        "Review the following {language} code with focus on: {focus}. "
+        "Provide constructive feedback on code quality, potential issues, "
+        "and suggested improvements."
+    )
+    _USER_TMPL = "Please review this code:\n\n```{language}\n{code}\n```"
+
     def __init__(self):
         """Initialize the code review prompt."""
         super().__init__(
@@ -58,28 +71,11 @@ class CodeReviewPrompt(BasePrompt):
             ValidationError: If required arguments are missing
         """
         self.validate_arguments(arguments)
-        arguments = arguments or {}
-
-        code = arguments['code']
-        language = arguments.get('language', 'unknown')
-        focus = arguments.get('focus', 'general best practices')
-
-        self.logger.debug(f"Generating {self.name} prompt for {language}")
-
-        messages = [
-            {
-                'role': 'system',
-                'content': (
-                    f"You are an expert code reviewer. "
-                    f"Review the following {language} code with focus on: {focus}. "
-                    f"Provide constructive feedback on code quality, potential issues, "
-                    f"and suggested improvements."
-                )
-            },
-            {
-                'role': 'user',
-                'content': f"Please review this code:\n\n```{language}\n{code}\n```"
-            }
-        ]
+        values = ChainMap(arguments, self._DEFAULTS)
+
+        self.logger.debug("Generating %s prompt for %s", self.name, values['language'])
 
-        return messages
+        return [
+            {'role': 'system', 'content': self._SYSTEM_TMPL.format_map(values)},
+            {'role': 'user', 'content': self._USER_TMPL.format_map(values)}
+        ]
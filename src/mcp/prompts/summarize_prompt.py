@@ -3,6 +3,7 @@ Summarize Prompt - Simple example prompt template.
 Provides guidance for text summarization tasks.
 """
 
+from collections import ChainMap
 from typing import Any, Dict, List, Optional
 
 from src.mcp.prompts.base_prompt import BasePrompt
@@ -20,6 +21,16 @@ class SummarizePrompt(BasePrompt):
     Note: This is an illustrative example demonstrating architecture.
     """
 
+    __slots__ = ()
+
+    _DEFAULTS = {'length': 'medium'}
+
+    _SYSTEM_TMPL = (
+        "You are a helpful assistant that creates {length} summaries. "
+        "Provide a clear, concise summary of the given text."
+    )
+    _USER_TMPL = "Please summarize the following text:\n\n{text}"
+
     def __init__(self):
         """Initialize the summarize prompt."""
         super().__init__(
@@ -53,25 +64,11 @@ class SummarizePrompt(BasePrompt):
             ValidationError: If required arguments are missing
         """
         self.validate_arguments(arguments)
-        arguments = arguments or {}
-
-        text = arguments['text']
-        length = arguments.get('length', 'medium')
-
-        self.logger.debug(f"Generating {self.name} prompt for {length} summary")
-
-        messages = [
-            {
-                'role': 'system',
-                'content': (
-                    f"You are a helpful assistant that creates {length} summaries. "
-                    f"Provide a clear, concise summary of the given text."
-                )
-            },
-            {
-                'role': 'user',
-                'content': f"Please summarize the following text:\n\n{text}"
-            }
-        ]
+        values = ChainMap(arguments, self._DEFAULTS)
+
+        self.logger.debug("Generating %s prompt for %s summary", self.name, values['length'])
 
-        return messages
+        return [
+            {'role': 'system', 'content': self._SYSTEM_TMPL.format_map(values)},
+            {'role': 'user', 'content': self._USER_TMPL.format_map(values)}
+        ]
@@ -3,7 +3,11 @@ Resource Registry for managing MCP resources.
 Provides centralized registration and discovery of available resources.
 """
 
-from typing import Dict, List, Optional
+import logging
+import os
+import sys
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from src.mcp.resources.base_resource import BaseResource
 from src.core.logging.logger import Logger
@@ -12,6 +16,44 @@ from src.core.errors.exceptions import (
     ResourceNotFoundError
 )
 
+# Registered resources, shared by every ResourceRegistry handle
+_RESOURCES: Dict[str, BaseResource] = {}
+
+# Cached name/metadata tuples; replaced whenever the registry changes
+_CACHE: Dict[str, Tuple[Any, ...]] = {}
+
+# Serializes writers; readers hold it only long enough to snapshot
+_LOCK = threading.RLock()
+
+# Sentinel for single-lookup removal
+_MISSING = object()
+
+
+def _add(resource: BaseResource) -> Optional[ResourceAlreadyExistsError]:
+    """
+    Add a resource to the shared registry; the caller holds _LOCK.
+
+    Args:
+        resource: Resource instance to add
+
+    Returns:
+        None if the resource was added, otherwise the (unraised) error for
+        a resource with the same URI
+    """
+    # Interned so lookups with the same literal hit the identity fast path
+    resource_uri = sys.intern(resource.uri)
+
+    # setdefault only inserts when the key is free: one hash probe
+    count = len(_RESOURCES)
+    _RESOURCES.setdefault(resource_uri, resource)
+    if len(_RESOURCES) == count:
+        return ResourceAlreadyExistsError(
+            f"Resource '{resource_uri}' is already registered",
+            {'resource_uri': resource_uri}
+        )
+
+    return None
+
 
 class ResourceRegistry:
     """
@@ -26,8 +68,9 @@ class ResourceRegistry:
     Implements singleton pattern to ensure single source of truth.
     """
 
+    __slots__ = ('logger', '_initialized')
+
     _instance: Optional['ResourceRegistry'] = None
-    _resources: Dict[str, BaseResource] = {}
 
     def __new__(cls) -> 'ResourceRegistry':
         """Implement singleton pattern."""
@@ -36,8 +79,15 @@ class ResourceRegistry:
         return cls._instance
 
     def __init__(self):
-        """Initialize the resource registry."""
-        self.logger = Logger.get_logger(__name__)
+        """Initialize the resource registry (once per process)."""
+        if getattr(self, '_initialized', False):
+            return
+        self._initialized = True
+        # Registry events are not logged in production (MCP_PROD set)
+        if os.environ.get('MCP_PROD'):
+            self.logger = Logger.get_null_logger(__name__)
+        else:
+            self.logger = Logger.get_logger(__name__)
 
     def register(self, resource: BaseResource) -> None:
         """
@@ -49,17 +99,55 @@ class ResourceRegistry:
         Raises:
             ResourceAlreadyExistsError: If resource with same URI exists
         """
-        resource_uri = resource.uri
+        global _CACHE
+        with _LOCK:
+            error = _add(resource)
+            if error is not None:
+                raise error
+
+            _CACHE = {}
+
+        if self.logger.isEnabledFor(logging.INFO):
+            resource_type = "dynamic" if resource.IS_DYNAMIC else "static"
+            self.logger.info("Registered %s resource: %s", resource_type, resource.uri)
+
+    def register_many(
+        self,
+        resources: Iterable[BaseResource]
+    ) -> List[Tuple[BaseResource, Exception]]:
+        """
+        Register several resources, collecting failures instead of raising.
 
-        if resource_uri in self._resources:
-            raise ResourceAlreadyExistsError(
-                f"Resource '{resource_uri}' is already registered",
-                {'resource_uri': resource_uri}
-            )
+        The whole batch is added under one lock acquisition and the listing
+        cache is invalidated once.
 
-        self._resources[resource_uri] = resource
-        resource_type = "dynamic" if resource.is_dynamic() else "static"
-        self.logger.info(f"Registered {resource_type} resource: {resource_uri}")
+        Args:
+            resources: Resource instances to register
+
+        Returns:
+            List of (resource, error) pairs for resources that were not registered
+        """
+        global _CACHE
+        failures: List[Tuple[BaseResource, Exception]] = []
+        with _LOCK:
+            before = len(_RESOURCES)
+            for resource in resources:
+                # Duplicates come back as values; only malformed resources raise
+                try:
+                    error = _add(resource)
+                except Exception as e:
+                    error = e
+                if error is not None:
+                    failures.append((resource, error))
+
+            count = len(_RESOURCES) - before
+            if count:
+                _CACHE = {}
+
+        if count:
+            self.logger.info("Registered %d resources", count)
+
+        return failures
 
     def unregister(self, resource_uri: str) -> None:
         """
@@ -71,14 +159,17 @@ class ResourceRegistry:
         Raises:
             ResourceNotFoundError: If resource not found
         """
-        if resource_uri not in self._resources:
-            raise ResourceNotFoundError(
-                f"Resource '{resource_uri}' not found in registry",
-                {'resource_uri': resource_uri}
-            )
+        global _CACHE
+        with _LOCK:
+            if _RESOURCES.pop(resource_uri, _MISSING) is _MISSING:
+                raise ResourceNotFoundError(
+                    f"Resource '{resource_uri}' not found in registry",
+                    {'resource_uri': resource_uri}
+                )
 
-        del self._resources[resource_uri]
-        self.logger.info(f"Unregistered resource: {resource_uri}")
+            _CACHE = {}
+
+        self.logger.info("Unregistered resource: %s", resource_uri)
 
     def get_resource(self, resource_uri: str) -> BaseResource:
         """
@@ -93,45 +184,70 @@ class ResourceRegistry:
         Raises:
             ResourceNotFoundError: If resource not found
         """
-        if resource_uri not in self._resources:
+        try:
+            with _LOCK:
+                return _RESOURCES[resource_uri]
+        except KeyError:
             raise ResourceNotFoundError(
                 f"Resource '{resource_uri}' not found in registry",
                 {'resource_uri': resource_uri}
-            )
-
-        return self._resources[resource_uri]
+            ) from None
 
     def list_resources(self) -> List[str]:
         """
         List all registered resource URIs.
 
         Returns:
-            List of resource URIs
+            New list of resource URIs, copied from a snapshot cached until
+            the registry changes
         """
-        return list(self._resources.keys())
+        uris = _CACHE.get('names')
+        if uris is None:
+            with _LOCK:
+                uris = _CACHE['names'] = tuple(_RESOURCES)
+        return list(uris)
 
-    def get_resources_metadata(self) -> List[Dict]:
+    def get_resources_metadata(self) -> List[Dict[str, Any]]:
         """
         Get metadata for all registered resources.
 
         Returns:
-            List of resource metadata dictionaries
+            New list of resource metadata dictionaries, copied from a snapshot
+            cached until the registry changes, so callers may modify them
         """
-        return [resource.to_dict() for resource in self._resources.values()]
-
-    def clear(self) -> None:
+        metadata = _CACHE.get('metadata')
+        if metadata is None:
+            with _LOCK:
+                cache = _CACHE
+                items = tuple(_RESOURCES.values())
+            # Built outside the lock; a concurrent change swaps in a new
+            # cache, so a stale result only lands in the discarded one
+            metadata = cache['metadata'] = tuple(resource.to_dict() for resource in items)
+        return [entry.copy() for entry in metadata]
+
+    def clear(self) -> int:
         """
         Clear all registered resources.
 
         Useful for testing and cleanup.
+
+        Returns:
+            Number of resources that were removed
         """
-        self._resources.clear()
+        global _CACHE
+        with _LOCK:
+            count = len(_RESOURCES)
+            _RESOURCES.clear()
+            _CACHE = {}
+
         self.logger.info("Cleared all resources from registry")
 
+        return count
+
     def __len__(self) -> int:
         """Return the number of registered resources."""
-        return len(self._resources)
+        return len(_RESOURCES)
 
     def __contains__(self, resource_uri: str) -> bool:
         """Check if a resource is registered."""
-        return resource_uri in self._resources
+        return resource_uri in _RESOURCES
@@ -3,8 +3,28 @@ MCP Resources package.
 Contains base resource abstraction and concrete resource implementations.
 """
 
+import importlib
+from typing import Any
+
 from src.mcp.resources.base_resource import BaseResource
-from src.mcp.resources.config_resource import ConfigResource
-from src.mcp.resources.status_resource import StatusResource
+
+# Concrete implementations are imported on first attribute access (PEP 562)
+_LAZY = {
+    'ConfigResource': 'src.mcp.resources.config_resource',
+    'StatusResource': 'src.mcp.resources.status_resource',
+}
 
 __all__ = ['BaseResource', 'ConfigResource', 'StatusResource']
+
+
+def __getattr__(name: str) -> Any:
+    """Import a concrete implementation on first access."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -3,21 +3,58 @@ Base abstraction for MCP Resources.
 Resources are read-only data sources (static or dynamic).
 """
 
-from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Optional, Protocol
 
 from src.core.logging.logger import Logger
 from src.core.errors.error_handler import ErrorHandler
 
 
-class BaseResource(ABC):
+class ResourceProtocol(Protocol):
+    """Static interface satisfied by every MCP resource."""
+
+    uri: str
+    name: str
+    IS_DYNAMIC: ClassVar[bool]
+
+    def read(self) -> Dict[str, Any]:
+        """Read the resource content."""
+        ...
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert resource to dictionary representation."""
+        ...
+
+
+class BaseResource:
     """
-    Abstract base class for all MCP resources.
+    Base class for all MCP resources.
 
     Resources provide read-only access to data (static or dynamic).
-    All concrete resources must inherit from this class.
+    All concrete resources must inherit from this class, set IS_DYNAMIC
+    and implement read (see ResourceProtocol for the interface).
     """
 
+    __slots__ = (
+        'uri',
+        'name',
+        'description',
+        'mime_type',
+        '_metadata',
+        'logger',
+        'error_handler'
+    )
+
+    # Whether content changes over time; every concrete resource sets it
+    IS_DYNAMIC: ClassVar[bool]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Require subclasses to declare IS_DYNAMIC."""
+        super().__init_subclass__(**kwargs)
+        if not isinstance(getattr(cls, 'IS_DYNAMIC', None), bool):
+            raise TypeError(
+                f"{cls.__name__} must define class attribute IS_DYNAMIC (bool)"
+            )
+
     def __init__(self, uri: str, name: str, description: str, mime_type: str = "text/plain"):
         """
         Initialize the base resource.
@@ -32,10 +69,11 @@ class BaseResource(ABC):
         self.name = name
         self.description = description
         self.mime_type = mime_type
-        self.logger = Logger.get_logger(self.__class__.__name__)
+        # Built on first use; metadata is fixed once the resource exists
+        self._metadata: Optional[Dict[str, Any]] = None
+        self.logger = Logger.get_class_logger(type(self))
         self.error_handler = ErrorHandler(self.__class__.__name__)
 
-    @abstractmethod
     def read(self) -> Dict[str, Any]:
         """
         Read the resource content.
@@ -47,18 +85,20 @@ class BaseResource(ABC):
 
         Raises:
             Various exceptions based on resource type
+            NotImplementedError: If not overridden by the concrete resource
         """
-        pass
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement read()"
+        )
 
-    @abstractmethod
     def is_dynamic(self) -> bool:
         """
         Check if resource is dynamic (content changes over time).
 
         Returns:
-            True if dynamic, False if static
+            The class-level IS_DYNAMIC flag
         """
-        pass
+        return self.IS_DYNAMIC
 
     def get_metadata(self) -> Dict[str, Any]:
         """
@@ -67,13 +107,15 @@ class BaseResource(ABC):
         Returns:
             Dictionary containing resource metadata
         """
-        return {
-            'uri': self.uri,
-            'name': self.name,
-            'description': self.description,
-            'mimeType': self.mime_type,
-            'isDynamic': self.is_dynamic()
-        }
+        if self._metadata is None:
+            self._metadata = {
+                'uri': self.uri,
+                'name': self.name,
+                'description': self.description,
+                'mimeType': self.mime_type,
+                'isDynamic': self.IS_DYNAMIC
+            }
+        return self._metadata.copy()
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -86,5 +128,5 @@ class BaseResource(ABC):
 
     def __repr__(self) -> str:
         """Return string representation of the resource."""
-        resource_type = "dynamic" if self.is_dynamic() else "static"
+        resource_type = "dynamic" if self.IS_DYNAMIC else "static"
         return f"{self.__class__.__name__}(uri={self.uri}, type={resource_type})"
@@ -3,10 +3,10 @@ Configuration Resource - Example static resource.
 Provides read-only access to configuration data.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Mapping, Optional
 
 from src.mcp.resources.base_resource import BaseResource
-from src.core.config.config_manager import ConfigManager
+from src.core.config.config_manager import get_config_manager
 
 
 class ConfigResource(BaseResource):
@@ -21,6 +21,11 @@ class ConfigResource(BaseResource):
     Note: This is an illustrative example demonstrating architecture.
     """
 
+    __slots__ = ('config', '_response', '_source')
+
+    # Configuration is static (doesn't change during runtime)
+    IS_DYNAMIC = False
+
     def __init__(self):
         """Initialize the configuration resource."""
         super().__init__(
@@ -29,7 +34,11 @@ class ConfigResource(BaseResource):
             description="Read-only access to application configuration",
             mime_type="application/json"
         )
-        self.config = ConfigManager()
+        self.config = get_config_manager()
+        self._response: Dict[str, Any] = {}
+        # Configuration view the snapshot was built from; reload() swaps it
+        self._source: Optional[Mapping[str, Any]] = None
+        self.invalidate()
 
     def read(self) -> Dict[str, Any]:
         """
@@ -38,34 +47,36 @@ class ConfigResource(BaseResource):
         Returns:
             Dictionary containing configuration content
         """
-        self.logger.debug(f"Reading resource: {self.uri}")
+        self.logger.debug("Reading resource: %s", self.uri)
+        if self.config.get_all() is not self._source:
+            self.invalidate()
+        # A fresh envelope around the shared read-only configuration view
+        return dict(self._response)
 
+    def invalidate(self) -> None:
+        """
+        Rebuild the cached response from the current configuration.
+
+        Reads do this by themselves once the configuration has been
+        reloaded; otherwise the snapshot is reused by every read.
+        """
         try:
-            config_data = self.config.get_all()
+            self._source = self.config.get_all()
 
-            return {
+            self._response = {
                 'uri': self.uri,
                 'mimeType': self.mime_type,
-                'content': config_data
+                'content': self._source
             }
 
         except Exception as e:
             self.error_handler.handle_error(
                 e,
-                context={'resource': self.uri}
+                resource=self.uri
             )
-            return {
+            self._response = {
                 'uri': self.uri,
                 'mimeType': self.mime_type,
                 'content': {},
                 'error': str(e)
             }
-
-    def is_dynamic(self) -> bool:
-        """
-        Configuration is static (doesn't change during runtime).
-
-        Returns:
-            False - this is a static resource
-        """
-        return False
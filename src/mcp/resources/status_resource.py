@@ -3,6 +3,7 @@ Status Resource - Example dynamic resource.
 Provides real-time system status information.
 """
 
+import time
 from datetime import datetime
 from typing import Any, Dict
 
@@ -21,8 +22,19 @@ class StatusResource(BaseResource):
     Note: This is an illustrative example demonstrating architecture.
     """
 
-    def __init__(self):
-        """Initialize the status resource."""
+    __slots__ = ('read_count', '_start', '_last_second', '_last_prefix')
+
+    # Status is dynamic (changes with each read)
+    IS_DYNAMIC = True
+
+    def __init__(self, monotonic_uptime: bool = False):
+        """
+        Initialize the status resource.
+
+        Args:
+            monotonic_uptime: Report seconds since creation, measured on a
+                monotonic clock, as uptime instead of the read-count proxy
+        """
         super().__init__(
             uri="status://system",
             name="System Status",
@@ -30,6 +42,10 @@ class StatusResource(BaseResource):
             mime_type="application/json"
         )
         self.read_count = 0
+        self._start = time.monotonic() if monotonic_uptime else None
+        # Date and time up to the second, formatted once per second
+        self._last_second = -1
+        self._last_prefix = ''
 
     def read(self) -> Dict[str, Any]:
         """
@@ -38,28 +54,26 @@ class StatusResource(BaseResource):
         Returns:
             Dictionary containing current status data
         """
-        self.logger.debug(f"Reading resource: {self.uri}")
+        self.logger.debug("Reading resource: %s", self.uri)
 
         try:
-            self.read_count += 1
-
-            status_data = {
-                'timestamp': datetime.now().isoformat(),
-                'status': 'operational',
-                'read_count': self.read_count,
-                'uptime_seconds': self._get_uptime()
-            }
+            read_count = self.read_count = self.read_count + 1
 
             return {
                 'uri': self.uri,
                 'mimeType': self.mime_type,
-                'content': status_data
+                'content': {
+                    'timestamp': self._get_timestamp(),
+                    'status': 'operational',
+                    'read_count': read_count,
+                    'uptime_seconds': self._get_uptime(read_count)
+                }
             }
 
         except Exception as e:
             self.error_handler.handle_error(
                 e,
-                context={'resource': self.uri}
+                resource=self.uri
             )
             return {
                 'uri': self.uri,
@@ -68,21 +82,37 @@ class StatusResource(BaseResource):
                 'error': str(e)
             }
 
-    def is_dynamic(self) -> bool:
+    def _get_timestamp(self) -> str:
         """
-        Status is dynamic (changes with each read).
+        Get the current local time in ISO format.
+
+        Same value as ``datetime.now().isoformat()``; only the part up to
+        the second is cached, the microseconds are added on every read.
 
         Returns:
-            True - this is a dynamic resource
+            ISO timestamp with microsecond precision
         """
-        return True
-
-    def _get_uptime(self) -> int:
+        second, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+        if second != self._last_second:
+            self._last_prefix = datetime.fromtimestamp(second).isoformat()
+            self._last_second = second
+        microsecond = nanoseconds // 1000
+        if microsecond:
+            return f"{self._last_prefix}.{microsecond:06d}"
+        return self._last_prefix
+
+    def _get_uptime(self, read_count: int) -> int:
         """
         Get a simple uptime metric.
 
+        Args:
+            read_count: Number of reads so far
+
         Returns:
-            Read count as proxy for uptime
+            Seconds since creation if monotonic uptime was requested,
+            otherwise read count as proxy for uptime
         """
+        if self._start is not None:
+            return int(time.monotonic() - self._start)
         # Simplified uptime - in real implementation would track actual uptime
-        return self.read_count * 10
+        return read_count * 10
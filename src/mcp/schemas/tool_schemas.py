@@ -3,7 +3,67 @@ JSON Schema definitions for MCP Tools.
 Provides schema validation and documentation for tool inputs/outputs.
 """
 
-from typing import Any, Dict
+from copy import deepcopy
+from typing import Any, Callable, Dict
+
+# JSON schema primitive types and their Python equivalents
+_TYPE_MAPPING = {
+    'string': str,
+    'number': (int, float),
+    'integer': int,
+    'boolean': bool,
+    'object': dict,
+    'array': list
+}
+
+
+def _make_checker(expected: Any) -> Callable[[Any], bool]:
+    """Build a type checker trying exact type identity before isinstance."""
+    if isinstance(expected, tuple):
+        return lambda value: type(value) in expected or isinstance(value, expected)
+    return lambda value: type(value) is expected or isinstance(value, expected)
+
+
+# Per-type checkers, so a type check is one lookup plus one call
+_CHECKERS: Dict[str, Callable[[Any], bool]] = {
+    json_type: _make_checker(python_type)
+    for json_type, python_type in _TYPE_MAPPING.items()
+}
+
+
+def _compile_validator(input_schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Build a validator specialized to an input schema.
+
+    Required fields and per-field type checkers are resolved once, so each
+    validation is a pair of flat loops with no schema lookups.
+
+    Args:
+        input_schema: JSON schema for input parameters
+
+    Returns:
+        Function returning True if the parameters satisfy the schema
+    """
+    required = frozenset(input_schema.get('required', ()))
+    checks = tuple(
+        (field, _CHECKERS[prop['type']])
+        for field, prop in input_schema.get('properties', {}).items()
+        if prop.get('type') in _CHECKERS
+    )
+
+    def validate(params: Dict[str, Any]) -> bool:
+        # Check required fields (a single C-level subset test)
+        if not required.issubset(params):
+            return False
+
+        # Check types (basic validation) with the same checkers as _check_type
+        for field, check in checks:
+            if field in params and not check(params[field]):
+                return False
+
+        return True
+
+    return validate
 
 
 class ToolSchema:
@@ -32,28 +92,72 @@ class ToolSchema:
         """
         self.name = name
         self.description = description
-        self.input_schema = input_schema
         self.output_schema = output_schema
+        # Setting input_schema also compiles its validator
+        self.input_schema = input_schema
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        """Get the JSON schema for input parameters."""
+        return self._input_schema
+
+    @input_schema.setter
+    def input_schema(self, input_schema: Dict[str, Any]) -> None:
+        """
+        Replace the input schema and recompile its validator.
+
+        Args:
+            input_schema: JSON schema for input parameters
+        """
+        self._input_schema = input_schema
+        self._validator = _compile_validator(input_schema)
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert schema to dictionary representation.
 
+        Built from the current attributes, so a schema customised after
+        construction (e.g. renamed by a subclass) reports its new values.
+
         Returns:
             Dictionary containing schema information
         """
         return {
             'name': self.name,
             'description': self.description,
-            'inputSchema': self.input_schema,
+            'inputSchema': self._input_schema,
             'outputSchema': self.output_schema
         }
 
+    def copy(self) -> 'ToolSchema':
+        """
+        Create an independent copy of the schema.
+
+        The schema dicts are copied deeply; the compiled validator is
+        reused, as it was built from an identical input schema.
+
+        Returns:
+            New ToolSchema equal to this one
+        """
+        clone = ToolSchema.__new__(ToolSchema)
+        clone.name = self.name
+        clone.description = self.description
+        clone.output_schema = deepcopy(self.output_schema)
+        clone._input_schema = deepcopy(self._input_schema)
+        clone._validator = self._validator
+        return clone
+
+    @property
+    def validator(self) -> Callable[[Dict[str, Any]], bool]:
+        """Get the validator compiled from the input schema."""
+        return self._validator
+
     def validate_input(self, params: Dict[str, Any]) -> bool:
         """
         Validate input parameters against schema.
 
-        Basic validation checking required fields and types.
+        Basic validation checking required fields and types, using the
+        validator compiled from the input schema at construction.
 
         Args:
             params: Input parameters to validate
@@ -61,37 +165,10 @@ class ToolSchema:
         Returns:
             True if validation passes
         """
-        required = self.input_schema.get('required', [])
-        properties = self.input_schema.get('properties', {})
-
-        # Check required fields
-        for field in required:
-            if field not in params:
-                return False
-
-        # Check types (basic validation)
-        for field, value in params.items():
-            if field in properties:
-                expected_type = properties[field].get('type')
-                if expected_type and not self._check_type(value, expected_type):
-                    return False
-
-        return True
+        return self._validator(params)
 
     @staticmethod
     def _check_type(value: Any, expected_type: str) -> bool:
         """Check if value matches expected JSON schema type."""
-        type_mapping = {
-            'string': str,
-            'number': (int, float),
-            'integer': int,
-            'boolean': bool,
-            'object': dict,
-            'array': list
-        }
-
-        expected_python_type = type_mapping.get(expected_type)
-        if expected_python_type is None:
-            return True
-
-        return isinstance(value, expected_python_type)
+        checker = _CHECKERS.get(expected_type)
+        return True if checker is None else checker(value)
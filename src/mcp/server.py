@@ -5,7 +5,7 @@ MCP server implementation supporting Tools, Resources, and Prompts.
 
 from typing import Any, Dict, List, Optional
 
-from src.core.config.config_manager import ConfigManager
+from src.core.config.config_manager import get_config_manager
 from src.core.logging.logger import Logger
 from src.core.errors.error_handler import ErrorHandler
 from src.mcp.tool_registry import ToolRegistry
@@ -15,9 +15,12 @@ from src.mcp.tools.base_tool import BaseTool
 from src.mcp.resources.base_resource import BaseResource
 from src.mcp.prompts.base_prompt import BasePrompt
 from src.mcp.server_initialization import ServerInitialization
-from src.mcp.server_operations import ServerOperations
+from src.mcp.server_operations import UNINITIALIZED_OPERATIONS
 from src.mcp.server_registry import ServerRegistry
 
+# Supported MCP primitives; each get_info() response gets its own copy
+_CAPABILITIES: Dict[str, bool] = {'tools': True, 'resources': True, 'prompts': True}
+
 
 class MCPServer:
     """
@@ -28,15 +31,33 @@ class MCPServer:
     via pluggable transport layers (STDIO, HTTP, WebSocket).
     """
 
+    __slots__ = (
+        'config',
+        '_name',
+        '_version',
+        'logger',
+        'error_handler',
+        'tool_registry',
+        'resource_registry',
+        'prompt_registry',
+        '_initialized',
+        '_initializer',
+        '_operations',
+        '_registry'
+    )
+
     def __init__(self):
         """
         Initialize the MCP server.
 
         Sets up infrastructure (config, logging, error handling) and
-        three singleton registries. Delegates to helper classes for
+        the component registries. Delegates to helper classes for
         initialization, operations, and registry management.
         """
-        self.config = ConfigManager()
+        self.config = get_config_manager()
+        # Server identity is fixed for the lifetime of the instance
+        self._name = self.config.get('mcp.server.name', 'MCP Server')
+        self._version = self.config.get('mcp.server.version', '1.0.0')
         self.logger = Logger.get_logger(__name__)
         self.error_handler = ErrorHandler(__name__)
         self.tool_registry = ToolRegistry()
@@ -46,7 +67,8 @@ class MCPServer:
 
         # Initialize helper components
         self._initializer = ServerInitialization(self)
-        self._operations = ServerOperations(self)
+        # Replaced by ServerOperations while the server is initialized
+        self._operations = UNINITIALIZED_OPERATIONS
         self._registry = ServerRegistry(self)
 
         self.logger.info("MCP Server instance created")
@@ -81,27 +103,27 @@ class MCPServer:
 
     def list_tools(self) -> List[str]:
         """List all registered tool names."""
-        return self._registry.list_tools()
+        return self.tool_registry.list_tools()
 
     def get_tools_metadata(self) -> List[Dict[str, Any]]:
         """Get metadata for all registered tools."""
-        return self._registry.get_tools_metadata()
+        return self.tool_registry.get_tools_metadata()
 
     def list_resources(self) -> List[str]:
         """List all registered resource URIs."""
-        return self._registry.list_resources()
+        return self.resource_registry.list_resources()
 
     def get_resources_metadata(self) -> List[Dict[str, Any]]:
         """Get metadata for all registered resources."""
-        return self._registry.get_resources_metadata()
+        return self.resource_registry.get_resources_metadata()
 
     def list_prompts(self) -> List[str]:
         """List all registered prompt names."""
-        return self._registry.list_prompts()
+        return self.prompt_registry.list_prompts()
 
     def get_prompts_metadata(self) -> List[Dict[str, Any]]:
         """Get metadata for all registered prompts."""
-        return self._registry.get_prompts_metadata()
+        return self.prompt_registry.get_prompts_metadata()
 
     def execute_tool(self, tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a registered tool with given parameters."""
@@ -127,14 +149,18 @@ class MCPServer:
         return self._initialized
 
     def get_info(self) -> Dict[str, Any]:
-        """Get server metadata and status."""
+        """
+        Get server metadata and status.
+
+        Returns a new dict on every call, so callers may modify it.
+        """
         return {
-            'name': self.config.get('mcp.server.name', 'MCP Server'),
-            'version': self.config.get('mcp.server.version', '1.0.0'),
+            'name': self._name,
+            'version': self._version,
             'description': 'MCP server with tools, resources, and prompts',
             'initialized': self._initialized,
             'tool_count': len(self.tool_registry),
             'resource_count': len(self.resource_registry),
             'prompt_count': len(self.prompt_registry),
-            'capabilities': {'tools': True, 'resources': True, 'prompts': True}
+            'capabilities': _CAPABILITIES.copy()
         }
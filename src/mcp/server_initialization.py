@@ -4,16 +4,29 @@ MCP Server Initialization.
 Handles server lifecycle operations including startup and shutdown.
 """
 
+import logging
 from typing import List, Optional
 
+from src.core.errors.exceptions import ResourceAlreadyExistsError
 from src.mcp.tools.base_tool import BaseTool
 from src.mcp.resources.base_resource import BaseResource
 from src.mcp.prompts.base_prompt import BasePrompt
+from src.mcp.server_operations import ServerOperations, UNINITIALIZED_OPERATIONS
 
 
 class ServerInitialization:
     """MCP Server initialization and lifecycle management."""
 
+    __slots__ = (
+        'server',
+        'logger',
+        'config',
+        'error_handler',
+        'tool_registry',
+        'resource_registry',
+        'prompt_registry'
+    )
+
     def __init__(self, server):
         """
         Initialize server lifecycle manager.
@@ -49,51 +62,37 @@ class ServerInitialization:
 
         self.logger.info("Initializing MCP Server")
 
-        # Get server configuration
-        server_name = self.config.get('mcp.server.name', 'MCP Server')
-        server_version = self.config.get('mcp.server.version', '1.0.0')
-
-        self.logger.info(f"Server: {server_name} v{server_version}")
-
-        # Register provided tools
-        if tools:
-            for tool in tools:
-                try:
-                    self.tool_registry.register(tool)
-                except Exception as e:
-                    self.error_handler.handle_error(
-                        e,
-                        context={'tool': tool.name}
-                    )
-
-        # Register provided resources
-        if resources:
-            for resource in resources:
-                try:
-                    self.resource_registry.register(resource)
-                except Exception as e:
-                    self.error_handler.handle_error(
-                        e,
-                        context={'resource': resource.uri}
-                    )
-
-        # Register provided prompts
-        if prompts:
-            for prompt in prompts:
-                try:
-                    self.prompt_registry.register(prompt)
-                except Exception as e:
-                    self.error_handler.handle_error(
-                        e,
-                        context={'prompt': prompt.name}
-                    )
+        self.logger.info("Server: %s v%s", self.server._name, self.server._version)
+
+        # Register provided components; duplicates only warrant a warning,
+        # anything else goes through the error handler
+        for tool, error in self.tool_registry.register_many(tools or ()):
+            if isinstance(error, ResourceAlreadyExistsError):
+                self.logger.warning("Tool %s already registered", tool.name)
+            else:
+                self.error_handler.handle_error(error, tool=tool.name)
+
+        for resource, error in self.resource_registry.register_many(resources or ()):
+            if isinstance(error, ResourceAlreadyExistsError):
+                self.logger.warning("Resource %s already registered", resource.uri)
+            else:
+                self.error_handler.handle_error(error, resource=resource.uri)
+
+        for prompt, error in self.prompt_registry.register_many(prompts or ()):
+            if isinstance(error, ResourceAlreadyExistsError):
+                self.logger.warning("Prompt %s already registered", prompt.name)
+            else:
+                self.error_handler.handle_error(error, prompt=prompt.name)
 
         self.server._initialized = True
-        self.logger.info(
-            f"MCP Server initialized with {len(self.tool_registry)} tools, "
-            f"{len(self.resource_registry)} resources, "
-            f"{len(self.prompt_registry)} prompts"
-        )
+        self.server._operations = ServerOperations(self.server)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "MCP Server initialized with %d tools, %d resources, %d prompts",
+                len(self.tool_registry),
+                len(self.resource_registry),
+                len(self.prompt_registry)
+            )
 
     def shutdown(self) -> None:
         """Shutdown the MCP server."""
@@ -103,17 +102,16 @@ class ServerInitialization:
 
         self.logger.info("Shutting down MCP Server")
 
-        # Clear all registries
-        tool_count = len(self.tool_registry)
-        resource_count = len(self.resource_registry)
-        prompt_count = len(self.prompt_registry)
-
-        self.tool_registry.clear()
-        self.resource_registry.clear()
-        self.prompt_registry.clear()
+        # Clear all registries; each reports how many entries it dropped
+        tool_count = self.tool_registry.clear()
+        resource_count = self.resource_registry.clear()
+        prompt_count = self.prompt_registry.clear()
 
         self.server._initialized = False
+        self.server._operations = UNINITIALIZED_OPERATIONS
         self.logger.info(
-            f"MCP Server shutdown ({tool_count} tools, "
-            f"{resource_count} resources, {prompt_count} prompts cleared)"
+            "MCP Server shutdown (%d tools, %d resources, %d prompts cleared)",
+            tool_count,
+            resource_count,
+            prompt_count
         )
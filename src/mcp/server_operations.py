@@ -2,13 +2,35 @@
 MCP Server Operations.
 
 Handles tool execution, resource reading, and prompt message generation.
+
+The server swaps between ServerOperations (while initialized) and
+UNINITIALIZED_OPERATIONS (before initialize() and after shutdown()), so
+the request path never re-checks the lifecycle state.
 """
 
 from typing import Any, Dict, Optional
 
+from src.core.errors.exceptions import ResourceNotFoundError, ValidationError
+
+# Responses for calls made before initialize(); handed out as copies so
+# callers may modify what they receive
+_ERR_NOT_INIT: Dict[str, Any] = {'success': False, 'error': 'Server not initialized'}
+_ERR_NOT_INIT_READ: Dict[str, Any] = {'error': 'Server not initialized'}
+
+# Client mistakes (unknown names, bad arguments); logged without traceback
+_EXPECTED_ERRORS = (ResourceNotFoundError, ValidationError)
+
 
 class ServerOperations:
-    """MCP Server execution operations."""
+    """MCP Server execution operations for an initialized server."""
+
+    __slots__ = (
+        'logger',
+        'error_handler',
+        'tool_registry',
+        'resource_registry',
+        'prompt_registry'
+    )
 
     def __init__(self, server):
         """
@@ -17,7 +39,6 @@ class ServerOperations:
         Args:
             server: MCPServer instance
         """
-        self.server = server
         self.logger = server.logger
         self.error_handler = server.error_handler
         self.tool_registry = server.tool_registry
@@ -39,23 +60,24 @@ class ServerOperations:
         Returns:
             Tool execution result
         """
-        if not self.server.is_initialized:
-            return {
-                'success': False,
-                'error': 'Server not initialized'
-            }
-
-        self.logger.info(f"Executing tool: {tool_name}")
+        self.logger.info("Executing tool: %s", tool_name)
 
         try:
             tool = self.tool_registry.get_tool(tool_name)
             result = tool.execute(params)
             return result
 
+        except _EXPECTED_ERRORS as e:
+            self.error_handler.handle_expected(e, tool_name=tool_name)
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
         except Exception as e:
             self.error_handler.handle_error(
                 e,
-                context={'tool_name': tool_name, 'params': params}
+                tool_name=tool_name, params=params
             )
             return {
                 'success': False,
@@ -72,22 +94,24 @@ class ServerOperations:
         Returns:
             Resource content and metadata
         """
-        if not self.server.is_initialized:
-            return {
-                'error': 'Server not initialized'
-            }
-
-        self.logger.info(f"Reading resource: {resource_uri}")
+        self.logger.info("Reading resource: %s", resource_uri)
 
         try:
             resource = self.resource_registry.get_resource(resource_uri)
             content = resource.read()
             return content
 
+        except _EXPECTED_ERRORS as e:
+            self.error_handler.handle_expected(e, resource_uri=resource_uri)
+            return {
+                'uri': resource_uri,
+                'error': str(e)
+            }
+
         except Exception as e:
             self.error_handler.handle_error(
                 e,
-                context={'resource_uri': resource_uri}
+                resource_uri=resource_uri
             )
             return {
                 'uri': resource_uri,
@@ -109,13 +133,7 @@ class ServerOperations:
         Returns:
             Dictionary containing messages or error
         """
-        if not self.server.is_initialized:
-            return {
-                'success': False,
-                'error': 'Server not initialized'
-            }
-
-        self.logger.info(f"Getting messages for prompt: {prompt_name}")
+        self.logger.info("Getting messages for prompt: %s", prompt_name)
 
         try:
             prompt = self.prompt_registry.get_prompt(prompt_name)
@@ -126,12 +144,49 @@ class ServerOperations:
                 'messages': messages
             }
 
+        except _EXPECTED_ERRORS as e:
+            self.error_handler.handle_expected(e, prompt_name=prompt_name)
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
         except Exception as e:
             self.error_handler.handle_error(
                 e,
-                context={'prompt_name': prompt_name, 'arguments': arguments}
+                prompt_name=prompt_name, arguments=arguments
             )
             return {
                 'success': False,
                 'error': str(e)
             }
+
+
+class UninitializedOperations:
+    """Operations of a server that is not initialized; every call is refused."""
+
+    __slots__ = ()
+
+    def execute_tool(
+        self,
+        tool_name: str,
+        params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Refuse tool execution."""
+        return _ERR_NOT_INIT.copy()
+
+    def read_resource(self, resource_uri: str) -> Dict[str, Any]:
+        """Refuse resource reads."""
+        return _ERR_NOT_INIT_READ.copy()
+
+    def get_prompt_messages(
+        self,
+        prompt_name: str,
+        arguments: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Refuse prompt rendering."""
+        return _ERR_NOT_INIT.copy()
+
+
+# Stateless, so one instance serves every server
+UNINITIALIZED_OPERATIONS = UninitializedOperations()
@@ -3,7 +3,9 @@ Tool Registry for managing MCP tools.
 Provides centralized registration and discovery of available tools.
 """
 
-from typing import Dict, List, Optional
+import sys
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from src.mcp.tools.base_tool import BaseTool
 from src.core.logging.logger import Logger
@@ -12,6 +14,9 @@ from src.core.errors.exceptions import (
     ResourceNotFoundError
 )
 
+# Sentinel for single-lookup removal
+_MISSING = object()
+
 
 class ToolRegistry:
     """
@@ -23,21 +28,22 @@ class ToolRegistry:
     - Listing all available tools
     - Tool metadata access
 
-    Implements singleton pattern to ensure single source of truth.
+    Each instance holds its own tools; share a registry by passing the
+    instance around (MCPServer owns one per server).
     """
 
-    _instance: Optional['ToolRegistry'] = None
-    _tools: Dict[str, BaseTool] = {}
-
-    def __new__(cls) -> 'ToolRegistry':
-        """Implement singleton pattern."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    __slots__ = ('logger', '_tools', '_cache', '_lock')
 
     def __init__(self):
-        """Initialize the tool registry."""
+        """Initialize an empty tool registry."""
         self.logger = Logger.get_logger(__name__)
+        # Published tool map; never mutated in place, writers swap in a
+        # new dict so readers can use whatever they load without locking
+        self._tools: Dict[str, BaseTool] = {}
+        # Cached name/metadata tuples; replaced whenever the registry changes
+        self._cache: Dict[str, Tuple[Any, ...]] = {}
+        # Serializes writers
+        self._lock = threading.RLock()
 
     def register(self, tool: BaseTool) -> None:
         """
@@ -49,16 +55,81 @@ class ToolRegistry:
         Raises:
             ResourceAlreadyExistsError: If tool with same name exists
         """
-        tool_name = tool.name
+        with self._lock:
+            tools = self._tools.copy()
+            error = self._add(tools, tool)
+            if error is not None:
+                raise error
+
+            self._tools = tools
+            self._cache = {}
+
+        self.logger.info("Registered tool: %s", tool.name)
+
+    def register_many(
+        self,
+        tools: Iterable[BaseTool]
+    ) -> List[Tuple[BaseTool, Exception]]:
+        """
+        Register several tools, collecting failures instead of raising.
+
+        The whole batch is added under one lock acquisition and published
+        (and the listing cache invalidated) once.
+
+        Args:
+            tools: Tool instances to register
+
+        Returns:
+            List of (tool, error) pairs for tools that were not registered
+        """
+        failures: List[Tuple[BaseTool, Exception]] = []
+        with self._lock:
+            updated = self._tools.copy()
+            for tool in tools:
+                # Duplicates come back as values; only malformed tools raise
+                try:
+                    error = self._add(updated, tool)
+                except Exception as e:
+                    error = e
+                if error is not None:
+                    failures.append((tool, error))
+
+            count = len(updated) - len(self._tools)
+            if count:
+                self._tools = updated
+                self._cache = {}
+
+        if count:
+            self.logger.info("Registered %d tools", count)
+
+        return failures
+
+    @staticmethod
+    def _add(
+        tools: Dict[str, BaseTool],
+        tool: BaseTool
+    ) -> Optional[ResourceAlreadyExistsError]:
+        """
+        Add a tool to an unpublished tool map.
+
+        Args:
+            tools: Tool map being prepared for publication
+            tool: Tool instance to add
 
-        if tool_name in self._tools:
-            raise ResourceAlreadyExistsError(
+        Returns:
+            None if the tool was added, otherwise the (unraised) error
+            for a tool with the same name
+        """
+        # Interned so lookups with the same literal hit the identity fast path
+        tool_name = sys.intern(tool.name)
+        if tool_name in tools:
+            return ResourceAlreadyExistsError(
                 f"Tool '{tool_name}' is already registered",
                 {'tool_name': tool_name}
             )
 
-        self._tools[tool_name] = tool
-        self.logger.info(f"Registered tool: {tool_name}")
+        tools[tool_name] = tool
+        return None
 
     def unregister(self, tool_name: str) -> None:
         """
@@ -70,14 +141,18 @@ class ToolRegistry:
         Raises:
             ResourceNotFoundError: If tool not found
         """
-        if tool_name not in self._tools:
-            raise ResourceNotFoundError(
-                f"Tool '{tool_name}' not found in registry",
-                {'tool_name': tool_name}
-            )
+        with self._lock:
+            tools = self._tools.copy()
+            if tools.pop(tool_name, _MISSING) is _MISSING:
+                raise ResourceNotFoundError(
+                    f"Tool '{tool_name}' not found in registry",
+                    {'tool_name': tool_name}
+                )
 
-        del self._tools[tool_name]
-        self.logger.info(f"Unregistered tool: {tool_name}")
+            self._tools = tools
+            self._cache = {}
+
+        self.logger.info("Unregistered tool: %s", tool_name)
 
     def get_tool(self, tool_name: str) -> BaseTool:
         """
@@ -92,41 +167,65 @@ class ToolRegistry:
         Raises:
             ResourceNotFoundError: If tool not found
         """
-        if tool_name not in self._tools:
+        tool = self._tools.get(tool_name)
+        if tool is None:
             raise ResourceNotFoundError(
                 f"Tool '{tool_name}' not found in registry",
                 {'tool_name': tool_name}
             )
 
-        return self._tools[tool_name]
+        return tool
 
     def list_tools(self) -> List[str]:
         """
         List all registered tool names.
 
         Returns:
-            List of tool names
+            New list of tool names, copied from a snapshot cached until
+            the registry changes
         """
-        return list(self._tools.keys())
-
-    def get_tools_metadata(self) -> List[Dict]:
+        # Load the cache before the map: a change in between then only
+        # ever leaves newer names in an already discarded cache
+        cache = self._cache
+        names = cache.get('names')
+        if names is None:
+            names = cache['names'] = tuple(self._tools)
+        return list(names)
+
+    def get_tools_metadata(self) -> List[Dict[str, Any]]:
         """
         Get metadata for all registered tools.
 
         Returns:
-            List of tool metadata dictionaries
+            New list of tool metadata dictionaries, copied from a snapshot
+            cached until the registry changes, so callers may modify them
         """
-        return [tool.to_dict() for tool in self._tools.values()]
+        cache = self._cache
+        metadata = cache.get('metadata')
+        if metadata is None:
+            metadata = cache['metadata'] = tuple(
+                tool.to_dict() for tool in self._tools.values()
+            )
+        return [entry.copy() for entry in metadata]
 
-    def clear(self) -> None:
+    def clear(self) -> int:
         """
         Clear all registered tools.
 
         Useful for testing and cleanup.
+
+        Returns:
+            Number of tools that were removed
         """
-        self._tools.clear()
+        with self._lock:
+            count = len(self._tools)
+            self._tools = {}
+            self._cache = {}
+
         self.logger.info("Cleared all tools from registry")
 
+        return count
+
     def __len__(self) -> int:
         """Return the number of registered tools."""
         return len(self._tools)
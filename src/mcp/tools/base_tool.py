@@ -4,7 +4,8 @@ All tools must inherit from BaseTool and implement the execute method.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, ClassVar, Dict
+from weakref import WeakKeyDictionary
 
 from src.core.logging.logger import Logger
 from src.core.errors.error_handler import ErrorHandler
@@ -19,11 +20,27 @@ class BaseTool(ABC):
     and execution. All concrete tools must inherit from this class.
     """
 
+    __slots__ = (
+        'logger',
+        'error_handler',
+        '_schema'
+    )
+
+    # Schemas describe a tool class, not an instance: _define_schema runs
+    # once per class and each instance gets its own copy of the result.
+    # Weak keys, so classes defined on the fly can still be collected
+    _SCHEMAS: ClassVar['WeakKeyDictionary[type, ToolSchema]'] = WeakKeyDictionary()
+
     def __init__(self):
         """Initialize the base tool."""
-        self.logger = Logger.get_logger(self.__class__.__name__)
-        self.error_handler = ErrorHandler(self.__class__.__name__)
-        self._schema = self._define_schema()
+        cls = type(self)
+        self.logger = Logger.get_class_logger(cls)
+        self.error_handler = ErrorHandler(cls.__name__)
+        schema = BaseTool._SCHEMAS.get(cls)
+        if schema is None:
+            schema = BaseTool._SCHEMAS.setdefault(cls, self._define_schema())
+        # Copied so that changing one tool's schema leaves the others alone
+        self._schema = schema.copy()
 
     @abstractmethod
     def _define_schema(self) -> ToolSchema:
@@ -35,6 +52,9 @@ class BaseTool(ABC):
         - Input parameter schema
         - Output schema
 
+        Called once per tool class, so it must not depend on instance
+        state; every instance receives its own copy of the result.
+
         Returns:
             ToolSchema instance defining the tool's interface
         """
@@ -67,12 +87,13 @@ class BaseTool(ABC):
         Returns:
             Dictionary containing execution result or error
         """
-        self.logger.info(f"Executing tool: {self.name}")
-        self.logger.debug(f"Parameters: {params}")
+        self.logger.info("Executing tool: %s", self.name)
+        self.logger.debug("Parameters: %s", params)
 
         try:
-            # Validate input parameters
-            if not self._schema.validate_input(params):
+            # Validate input parameters with the schema's current validator,
+            # which is recompiled whenever its input schema is replaced
+            if not self._schema.validator(params):
                 error_msg = f"Invalid parameters for tool {self.name}"
                 self.logger.error(error_msg)
                 return {
@@ -83,7 +104,7 @@ class BaseTool(ABC):
             # Execute tool logic
             result = self._execute_impl(params)
 
-            self.logger.info(f"Tool {self.name} executed successfully")
+            self.logger.info("Tool %s executed successfully", self.name)
             return {
                 'success': True,
                 'result': result
@@ -92,7 +113,7 @@ class BaseTool(ABC):
         except Exception as e:
             self.error_handler.handle_error(
                 e,
-                context={'tool': self.name, 'params': params}
+                tool=self.name, params=params
             )
             return {
                 'success': False,
@@ -101,12 +122,12 @@ class BaseTool(ABC):
 
     @property
     def name(self) -> str:
-        """Get the tool name."""
+        """Get the tool name, as currently set on its schema."""
         return self._schema.name
 
     @property
     def description(self) -> str:
-        """Get the tool description."""
+        """Get the tool description, as currently set on its schema."""
         return self._schema.description
 
     @property
@@ -5,8 +5,11 @@ This tool showcases multiprocessing for computationally intensive tasks, satisfy
 the parallel processing requirements outlined in software submission guidelines.
 """
 
-from typing import Any, Dict, List
+import atexit
+import threading
+from typing import Any, Dict, List, Optional
 from multiprocessing import Pool, cpu_count
+from multiprocessing.pool import Pool as PoolType
 
 from src.mcp.tools.base_tool import BaseTool
 from src.mcp.schemas.tool_schemas import ToolSchema
@@ -37,6 +40,123 @@ def _compute_intensive_operation(number: float) -> float:
     return result
 
 
+def _compute_closed_form(number: float) -> float:
+    """
+    Compute _compute_intensive_operation's result without the busy loop.
+
+    The loop only adds sum(i * 0.0001 for i in range(1000)) == 49.95 before
+    the modulo; reducing the square first keeps the result within float
+    rounding of the loop for large inputs too.
+
+    Args:
+        number: Input number to process
+
+    Returns:
+        Processed result, equal to the simulated one up to float rounding
+    """
+    return (number ** 2 % 1000000 + 49.95) % 1000000
+
+
+# Batches this small run inline: at roughly 0.1 ms of work per item,
+# dispatching them to worker processes costs more than it saves
+_INLINE_MAX_ITEMS = 16
+
+# Worker processes are kept between calls so repeated batches do not pay
+# process startup again; the pool is rebuilt only when its size changes.
+# The lock guards only fetching or replacing the pool, never the map itself;
+# a replaced pool is closed and joined once its last batch has finished.
+_POOL: Optional[PoolType] = None
+_POOL_SIZE = 0
+_POOL_USERS: Dict[PoolType, int] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _shutdown(pool: PoolType) -> None:
+    """
+    Stop a pool after its submitted work completes and reap its processes.
+
+    Args:
+        pool: Pool no longer handed out to new batches
+    """
+    pool.close()
+    pool.join()
+
+
+def _acquire_pool(workers: int) -> PoolType:
+    """
+    Get the shared worker pool for a batch, creating or resizing it as needed.
+
+    Every call must be paired with _release_pool.
+
+    Args:
+        workers: Number of worker processes required
+
+    Returns:
+        Pool with exactly that many worker processes
+    """
+    global _POOL, _POOL_SIZE
+    retired = None
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_SIZE != workers:
+            if _POOL is not None and not _POOL_USERS.get(_POOL):
+                retired = _POOL
+            _POOL = Pool(processes=workers)
+            _POOL_SIZE = workers
+        pool = _POOL
+        _POOL_USERS[pool] = _POOL_USERS.get(pool, 0) + 1
+    if retired is not None:
+        _shutdown(retired)
+    return pool
+
+
+def _release_pool(pool: PoolType) -> None:
+    """
+    Return a pool taken with _acquire_pool, shutting it down if replaced.
+
+    Args:
+        pool: Pool the finished batch ran on
+    """
+    with _POOL_LOCK:
+        users = _POOL_USERS[pool] - 1
+        if users:
+            _POOL_USERS[pool] = users
+            return
+        del _POOL_USERS[pool]
+        if pool is _POOL:
+            return
+    _shutdown(pool)
+
+
+def _map_in_pool(items: List[float], workers: int) -> List[float]:
+    """
+    Process items on the shared worker pool.
+
+    Args:
+        items: Numbers to process
+        workers: Number of worker processes to use
+
+    Returns:
+        Results in the same order as items
+    """
+    pool = _acquire_pool(workers)
+    try:
+        # pool.map distributes work across processes
+        # Returns results in the same order as input
+        return pool.map(_compute_intensive_operation, items)
+    finally:
+        _release_pool(pool)
+
+
+@atexit.register
+def _close_pool() -> None:
+    """Shut down the shared worker pool at interpreter exit."""
+    global _POOL, _POOL_SIZE
+    with _POOL_LOCK:
+        pool, _POOL, _POOL_SIZE = _POOL, None, 0
+    if pool is not None:
+        _shutdown(pool)
+
+
 class BatchProcessorTool(BaseTool):
     """
     Batch processor for CPU-bound parallel processing using multiprocessing.
@@ -45,6 +165,8 @@ class BatchProcessorTool(BaseTool):
     true parallelism for CPU-intensive computations across multiple cores.
     """
 
+    __slots__ = ()
+
     def _define_schema(self) -> ToolSchema:
         """Define the batch processor tool schema."""
         return ToolSchema(
@@ -65,6 +187,14 @@ class BatchProcessorTool(BaseTool):
                         'minimum': 1,
                         'maximum': cpu_count() * 2,
                         'default': cpu_count()
+                    },
+                    'simulate': {
+                        'type': 'boolean',
+                        'description': (
+                            'Run the simulated CPU load (default: true); '
+                            'false computes the same results directly, in process'
+                        ),
+                        'default': True
                     }
                 },
                 'required': ['items']
@@ -93,6 +223,7 @@ class BatchProcessorTool(BaseTool):
         """Execute CPU-intensive batch processing with multiprocessing."""
         items = params.get('items', [])
         workers = params.get('workers', cpu_count())
+        simulate = params.get('simulate', True)
 
         # Validate items
         if not isinstance(items, list):
@@ -113,18 +244,24 @@ class BatchProcessorTool(BaseTool):
         # Ensure workers is within valid range
         workers = max(1, min(workers, cpu_count() * 2))
 
+        # One worker gives no parallelism, and a small batch (or the cheap
+        # closed form) finishes sooner than the pickling round trip; run
+        # those in this process
+        if not simulate or len(items) <= _INLINE_MAX_ITEMS:
+            workers = 1
+
         self.logger.info(
-            f"Processing {len(items)} items using {workers} worker processes"
+            "Processing %d items using %d worker processes", len(items), workers
         )
 
-        # Use multiprocessing.Pool for parallel CPU-bound processing
-        # Pool automatically manages process lifecycle
-        with Pool(processes=workers) as pool:
-            # pool.map distributes work across processes
-            # Returns results in the same order as input
-            results = pool.map(_compute_intensive_operation, items)
+        if not simulate:
+            results = [_compute_closed_form(item) for item in items]
+        elif workers == 1:
+            results = [_compute_intensive_operation(item) for item in items]
+        else:
+            results = _map_in_pool(items, workers)
 
-        self.logger.info(f"Batch processing completed: {len(results)} items processed")
+        self.logger.info("Batch processing completed: %d items processed", len(results))
 
         return {
             'results': results,
@@ -3,13 +3,23 @@ Calculator Tool - Example MCP Tool for arithmetic operations.
 This is an illustrative placeholder demonstrating tool implementation.
 """
 
-from typing import Any, Dict
+import operator
+from typing import Any, Callable, Dict
 
 from src.mcp.tools.base_tool import BaseTool
 from src.mcp.schemas.tool_schemas import ToolSchema
 from src.core.errors.exceptions import ValidationError
 
 
+# Supported operations, dispatched with a single lookup
+_OPERATIONS: Dict[str, Callable[[Any, Any], Any]] = {
+    'add': operator.add,
+    'subtract': operator.sub,
+    'multiply': operator.mul,
+    'divide': operator.truediv
+}
+
+
 class CalculatorTool(BaseTool):
     """
     Example tool for basic arithmetic calculations.
@@ -23,6 +33,8 @@ class CalculatorTool(BaseTool):
     Note: This is a placeholder example to demonstrate architecture.
     """
 
+    __slots__ = ()
+
     def _define_schema(self) -> ToolSchema:
         """Define the calculator tool schema."""
         return ToolSchema(
@@ -33,7 +45,7 @@ class CalculatorTool(BaseTool):
                 'properties': {
                     'operation': {
                         'type': 'string',
-                        'enum': ['add', 'subtract', 'multiply', 'divide'],
+                        'enum': list(_OPERATIONS),
                         'description': 'Arithmetic operation to perform'
                     },
                     'a': {
@@ -75,25 +87,21 @@ class CalculatorTool(BaseTool):
         a = params['a']
         b = params['b']
 
-        self.logger.debug(f"Calculating: {a} {operation} {b}")
-
-        if operation == 'add':
-            result = a + b
-        elif operation == 'subtract':
-            result = a - b
-        elif operation == 'multiply':
-            result = a * b
-        elif operation == 'divide':
-            if b == 0:
-                raise ValidationError(
-                    "Division by zero is not allowed",
-                    {'a': a, 'b': b}
-                )
-            result = a / b
-        else:
+        self.logger.debug("Calculating: %s %s %s", a, operation, b)
+
+        apply = _OPERATIONS.get(operation)
+        if apply is None:
             raise ValidationError(
                 f"Invalid operation: {operation}",
                 {'operation': operation}
             )
 
+        try:
+            result = apply(a, b)
+        except ZeroDivisionError:
+            raise ValidationError(
+                "Division by zero is not allowed",
+                {'a': a, 'b': b}
+            )
+
         return {'result': result}
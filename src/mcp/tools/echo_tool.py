@@ -3,6 +3,7 @@ Echo Tool - Simple example MCP Tool.
 This is an illustrative placeholder demonstrating basic tool implementation.
 """
 
+import logging
 from typing import Any, Dict
 
 from src.mcp.tools.base_tool import BaseTool
@@ -21,6 +22,8 @@ class EchoTool(BaseTool):
     Note: This is a placeholder example to demonstrate architecture.
     """
 
+    __slots__ = ()
+
     def _define_schema(self) -> ToolSchema:
         """Define the echo tool schema."""
         return ToolSchema(
@@ -47,6 +50,28 @@ class EchoTool(BaseTool):
             }
         )
 
+    def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Echo the message, skipping the generic path when nothing is logged.
+
+        A plain string message is all the schema asks for, and with INFO
+        disabled the generic path would only add logging checks around it.
+
+        Args:
+            params: Input parameters for the tool
+
+        Returns:
+            Dictionary containing execution result or error
+        """
+        try:
+            message = params.get('message')
+        except AttributeError:
+            # Not a mapping: let the generic path report the usual error
+            return super().execute(params)
+        if type(message) is str and not self.logger.isEnabledFor(logging.INFO):
+            return {'success': True, 'result': {'echo': message}}
+        return super().execute(params)
+
     def _execute_impl(self, params: Dict[str, Any]) -> Any:
         """
         Echo back the message.
@@ -58,6 +83,6 @@ class EchoTool(BaseTool):
             Dictionary with echoed message
         """
         message = params['message']
-        self.logger.debug(f"Echoing message: {message}")
+        self.logger.debug("Echoing message: %s", message)
 
         return {'echo': message}
@@ -3,9 +3,10 @@ Base model class providing common functionality.
 All domain models should inherit from this class.
 """
 
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 
 class BaseModel(ABC):
@@ -14,12 +15,51 @@ class BaseModel(ABC):
 
     Provides common functionality like validation,
     serialization, and timestamp management.
+    Subclasses declare __slots__ for their own fields.
     """
 
+    __slots__ = (
+        '_created_ns',
+        '_updated_ns',
+        '_created_iso',
+        '_updated_iso'
+    )
+
     def __init__(self):
         """Initialize the base model with timestamps."""
-        self.created_at: datetime = datetime.now()
-        self.updated_at: datetime = datetime.now()
+        # Timestamps are kept as integer nanoseconds since the epoch and
+        # turned into datetimes only when read
+        now = time.time_ns()
+        self._created_ns = now
+        self._updated_ns = now
+        # ISO strings are formatted on first serialization; timestamps only
+        # change through update_timestamp, which drops the stale one
+        self._created_iso: Optional[str] = None
+        self._updated_iso: Optional[str] = None
+
+    @staticmethod
+    def _to_datetime(ns: int) -> datetime:
+        """
+        Convert epoch nanoseconds to a local datetime.
+
+        Args:
+            ns: Nanoseconds since the epoch
+
+        Returns:
+            Naive local datetime, exact to the microsecond
+        """
+        seconds, remainder = divmod(ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=remainder // 1000)
+
+    @property
+    def created_at(self) -> datetime:
+        """Time the model was created."""
+        return self._to_datetime(self._created_ns)
+
+    @property
+    def updated_at(self) -> datetime:
+        """Time the model was last updated."""
+        return self._to_datetime(self._updated_ns)
 
     @abstractmethod
     def validate(self) -> bool:
@@ -41,14 +81,25 @@ class BaseModel(ABC):
         Returns:
             Dictionary representation of the model
         """
+        created_iso = self._created_iso
+        if created_iso is None:
+            created_iso = self._created_iso = self.created_at.isoformat()
+        updated_iso = self._updated_iso
+        if updated_iso is None:
+            if self._updated_ns == self._created_ns:
+                updated_iso = created_iso
+            else:
+                updated_iso = self.updated_at.isoformat()
+            self._updated_iso = updated_iso
         return {
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': created_iso,
+            'updated_at': updated_iso
         }
 
     def update_timestamp(self) -> None:
         """Update the model's updated_at timestamp."""
-        self.updated_at = datetime.now()
+        self._updated_ns = time.time_ns()
+        self._updated_iso = None
 
     def __repr__(self) -> str:
         """Return string representation of the model."""
@@ -7,6 +7,10 @@ from typing import Any, Dict, Optional
 from src.models.base_model import BaseModel
 from src.core.errors.exceptions import ValidationError
 
+# Allowed statuses, in the order reported by validation errors
+_STATUSES = ('active', 'inactive', 'pending')
+_VALID_STATUSES = frozenset(_STATUSES)
+
 
 class Resource(BaseModel):
     """
@@ -16,6 +20,13 @@ class Resource(BaseModel):
     Demonstrates validation and OOP principles.
     """
 
+    __slots__ = (
+        'resource_id',
+        'name',
+        'status',
+        'metadata'
+    )
+
     def __init__(
         self,
         resource_id: str,
@@ -61,10 +72,11 @@ class Resource(BaseModel):
                 {'name': self.name}
             )
 
-        valid_statuses = ['active', 'inactive', 'pending']
-        if self.status not in valid_statuses:
+        # Only strings can match, and the str check keeps unhashable
+        # values out of the set lookup
+        if not isinstance(self.status, str) or self.status not in _VALID_STATUSES:
             raise ValidationError(
-                f"status must be one of {valid_statuses}",
+                f"status must be one of {list(_STATUSES)}",
                 {'status': self.status}
             )
 
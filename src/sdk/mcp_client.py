@@ -6,6 +6,7 @@ Wraps transport communication and exposes simple methods for
 tools, resources, and prompts.
 """
 
+from itertools import count
 from typing import Any, Dict, List, Optional
 
 from src.core.logging.logger import Logger
@@ -31,13 +32,14 @@ class MCPClient:
         self.transport = transport
         self.logger = Logger.get_logger("MCPClient")
         self.error_handler = ErrorHandler("MCPClient")
-        self._request_id = 0
+        # IDs "req-1", "req-2", ...; advancing the C iterator is atomic
+        # under the GIL, unlike a read-increment-write on an int attribute
+        self._request_ids = map("req-{}".format, count(1))
         self._operations = ClientOperations(self._send_request)
 
     def _next_request_id(self) -> str:
         """Generate next request ID."""
-        self._request_id += 1
-        return f"req-{self._request_id}"
+        return next(self._request_ids)
 
     def _send_request(
         self,
@@ -57,11 +59,13 @@ class MCPClient:
         Raises:
             Exception: If no response or server returns error
         """
+        # A fresh dict per request: transports may keep the message they were
+        # given (queues, mocks), so a reused template would be overwritten
         request = {"method": method, "id": self._next_request_id()}
         if params:
             request["params"] = params
 
-        self.logger.debug(f"Sending request: {method}")
+        self.logger.debug("Sending request: %s", method)
         self.transport.send_message(request)
 
         response = self.transport.receive_message()
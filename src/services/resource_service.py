@@ -68,7 +68,7 @@ class ResourceService:
         except ValidationError as e:
             self.error_handler.handle_error(
                 e,
-                context={'resource_id': resource_id},
+                resource_id=resource_id,
                 reraise=True
             )
             raise  # For type checker
@@ -7,11 +7,31 @@ This is the recommended transport for MCP servers.
 
 import sys
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 
 from src.transport.base_transport import BaseTransport
 
 
+def _json_default(obj: Any) -> Any:
+    """
+    Serialize read-only mappings (e.g. configuration views) as objects.
+
+    Args:
+        obj: Value the json module cannot encode itself
+
+    Returns:
+        Plain dict copy of a mapping
+
+    Raises:
+        TypeError: If the value is not a mapping
+    """
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(
+        f"Object of type {type(obj).__name__} is not JSON serializable"
+    )
+
+
 class STDIOTransport(BaseTransport):
     """
     STDIO-based transport implementation.
@@ -52,7 +72,7 @@ class STDIOTransport(BaseTransport):
     def send_message(self, message: Dict[str, Any]) -> None:
         """Send a message via stdout as newline-delimited JSON."""
         try:
-            json_message = json.dumps(message)
+            json_message = json.dumps(message, default=_json_default)
             self._output_stream.write(json_message + '\n')
             self._output_stream.flush()
             self.logger.debug(f"Sent message: {json_message[:100]}...")
@@ -88,7 +88,7 @@ class TransportHandler:
 
         except Exception as e:
             self.logger.error(f"Error handling message: {str(e)}")
-            self.error_handler.handle_error(e, context={'message': message})
+            self.error_handler.handle_error(e, message=message)
             return self._error_response(
                 str(e),
                 "internal_error",
@@ -2,19 +2,32 @@
 Unit tests for ConfigManager.
 """
 
+import os
+from collections.abc import Mapping
+
 import pytest
-from src.core.config.config_manager import ConfigManager
+from src.core.config import config_manager
+from src.core.config.config_manager import ConfigManager, get_config_manager
 
 
 @pytest.mark.unit
 class TestConfigManager:
     """Test suite for ConfigManager class."""
 
-    def test_singleton_pattern(self):
-        """Test that ConfigManager implements singleton pattern."""
+    def test_instances_share_configuration(self):
+        """Test that all ConfigManager instances see the same configuration."""
         config1 = ConfigManager()
         config2 = ConfigManager()
-        assert config1 is config2
+        assert config1.get_all() == config2.get_all()
+
+    def test_get_config_manager_returns_shared_instance(self):
+        """Test that the factory hands out one cached instance."""
+        assert get_config_manager() is get_config_manager()
+        assert isinstance(get_config_manager(), ConfigManager)
+
+    def test_module_level_access(self):
+        """Test that module functions serve the same values as the facade."""
+        assert config_manager.get('app.name') == ConfigManager().get('app.name')
 
     def test_get_existing_key(self):
         """Test getting an existing configuration key."""
@@ -29,6 +42,18 @@ class TestConfigManager:
         log_level = config.get('logging.level')
         assert log_level is not None
 
+    def test_get_intermediate_key_returns_section(self):
+        """Test that a dotted prefix resolves to the nested section."""
+        config = ConfigManager()
+        section = config.get('logging')
+        assert isinstance(section, dict)
+        assert section['level'] == config.get('logging.level')
+
+    def test_get_key_below_leaf_returns_default(self):
+        """Test that paths extending past a leaf value return default."""
+        config = ConfigManager()
+        assert config.get('logging.level.extra', 'fallback') == 'fallback'
+
     def test_get_nonexistent_key_with_default(self):
         """Test getting non-existent key returns default value."""
         config = ConfigManager()
@@ -39,9 +64,16 @@ class TestConfigManager:
         """Test getting all configuration values."""
         config = ConfigManager()
         all_config = config.get_all()
-        assert isinstance(all_config, dict)
+        assert isinstance(all_config, Mapping)
         assert 'app' in all_config or 'logging' in all_config
 
+    def test_get_all_is_read_only_view(self):
+        """Test that get_all returns a view that cannot be mutated."""
+        all_config = ConfigManager().get_all()
+        with pytest.raises(TypeError):
+            all_config['app'] = {}
+        assert ConfigManager().get_all() is all_config
+
     def test_reload_config(self):
         """Test reloading configuration."""
         config = ConfigManager()
@@ -53,6 +85,25 @@ class TestConfigManager:
         # Should still have same values
         assert config.get('app.name') == initial_value
 
+    def test_load_yaml_reuses_parse_until_modified(self, tmp_path):
+        """Test that unchanged YAML files are served from the parse cache."""
+        path = tmp_path / 'sample.yaml'
+        path.write_text('section:\n  value: 1\n')
+
+        first = config_manager._load_yaml(path)
+        first['section']['value'] = 99
+        assert config_manager._load_yaml(path) == {'section': {'value': 1}}
+
+        path.write_text('section:\n  value: 2\n')
+        os.utime(path, ns=(0, 10 ** 9))
+        assert config_manager._load_yaml(path) == {'section': {'value': 2}}
+
+    def test_deep_update_merges_nested_sections(self):
+        """Test that overrides merge into nested sections instead of replacing them."""
+        base = {'a': {'b': 1, 'c': {'d': 2}}, 'e': 3}
+        config_manager._deep_update(base, {'a': {'c': {'d': 5}, 'f': 6}, 'e': {'g': 7}})
+        assert base == {'a': {'b': 1, 'c': {'d': 5}, 'f': 6}, 'e': {'g': 7}}
+
     def test_local_config_override(self, tmp_path):
         """Test local.yaml overrides base config."""
         # This test verifies the local config loading path
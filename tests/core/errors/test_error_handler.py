@@ -2,8 +2,12 @@
 Unit tests for ErrorHandler.
 """
 
+import logging
+
 import pytest
-from src.core.errors.error_handler import ErrorHandler
+from src.core.config import config_manager
+from src.core.errors import error_handler as error_handler_module
+from src.core.errors.error_handler import ErrorHandler, _get_handler
 from src.core.errors.exceptions import ValidationError
 
 
@@ -50,6 +54,29 @@ class TestErrorHandler:
         )
         assert result is None
 
+    def test_safe_execute_reuses_handler(self):
+        """Test that handlers are memoized per logger name."""
+        assert _get_handler("test_module") is _get_handler("test_module")
+        assert _get_handler("test_module") is not _get_handler("other_module")
+
+    def test_reload_updates_existing_handlers(self, error_handler, monkeypatch):
+        """Test that handlers built before a reload follow the new flags."""
+        overrides = {'error_handling.raise_on_critical': True}
+        original_get = config_manager.get
+        monkeypatch.setattr(
+            config_manager, 'get',
+            lambda key, default=None: overrides.get(key, original_get(key, default))
+        )
+        config_manager.reload()
+        try:
+            with pytest.raises(ValidationError):
+                error_handler.handle_error(ValidationError("After reload"))
+        finally:
+            monkeypatch.undo()
+            config_manager.reload()
+
+        assert error_handler_module._settings == error_handler_module._load_settings()
+
     def test_handle_error_logs_exception(self, error_handler):
         """Test that handle_error processes exception without raising."""
         try:
@@ -57,3 +84,82 @@ class TestErrorHandler:
         except ValidationError as e:
             # Should not raise
             error_handler.handle_error(e, context={"test": "context"})
+
+    def test_handle_error_defers_formatting_to_logger(self, error_handler):
+        """Test that the error record carries the exception for lazy rendering."""
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        error_handler.logger.addHandler(handler)
+        try:
+            try:
+                raise ValidationError("Lazy error", {"field": "value"})
+            except ValidationError as e:
+                error_handler.handle_error(e, tool="echo")
+        finally:
+            error_handler.logger.removeHandler(handler)
+
+        assert len(records) == 1
+        record = records[0]
+        assert record.getMessage() == (
+            "Error occurred: ValidationError: Lazy error "
+            "(details: {'field': 'value'}) (context: {'tool': 'echo'})"
+        )
+        assert record.error['type'] == 'ValidationError'
+        assert 'traceback' not in record.error
+        if error_handler_module._settings.include_traceback:
+            assert record.exc_info[1].message == "Lazy error"
+
+    def test_handler_has_no_instance_dict(self, error_handler):
+        """Test that handler attributes are stored in slots."""
+        assert not hasattr(error_handler, '__dict__')
+
+    def test_handle_error_accepts_keyword_context(self, error_handler):
+        """Test that context can be passed as keyword arguments."""
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        error_handler.logger.addHandler(handler)
+        try:
+            error_handler.handle_error(ValueError("a"), tool_name='echo')
+            error_handler.handle_error(
+                ValueError("b"), context={'tool_name': 'echo'}, params={}
+            )
+        finally:
+            error_handler.logger.removeHandler(handler)
+
+        assert records[0].error['context'] == {'tool_name': 'echo'}
+        assert records[1].error['context'] == {'tool_name': 'echo', 'params': {}}
+
+    def test_handle_expected_logs_warning_without_traceback(self, error_handler):
+        """Test that expected errors produce a single warning line."""
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        error_handler.logger.addHandler(handler)
+        settings = error_handler_module._settings
+        error_handler_module._settings = settings._replace(raise_on_critical=False)
+        try:
+            error_handler.handle_expected(
+                ValidationError("Bad input", {'field': 'x'}), tool_name='echo'
+            )
+        finally:
+            error_handler_module._settings = settings
+            error_handler.logger.removeHandler(handler)
+
+        assert len(records) == 1
+        record = records[0]
+        assert record.levelno == logging.WARNING
+        assert record.getMessage() == "ValidationError: Bad input"
+        assert record.exc_info is None
+        assert record.context == {'tool_name': 'echo'}
+
+    def test_handle_expected_honors_raise_on_critical(self, error_handler):
+        """Test that expected errors are re-raised under raise_on_critical."""
+        settings = error_handler_module._settings
+        error_handler_module._settings = settings._replace(raise_on_critical=True)
+        try:
+            with pytest.raises(ValidationError):
+                error_handler.handle_expected(ValidationError("Bad input"))
+        finally:
+            error_handler_module._settings = settings
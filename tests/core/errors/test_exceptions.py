@@ -32,6 +32,19 @@ class TestExceptions:
         assert error.details == details
         assert 'key' in str(error)
 
+    def test_base_error_details_are_mutable_and_independent(self):
+        """Test that each error gets its own details dict callers can extend."""
+        first = BaseApplicationError("First")
+        second = ValidationError("Second")
+        first.details['key'] = 'value'
+        assert first.details == {'key': 'value'}
+        assert second.details == {}
+
+    def test_base_error_keeps_caller_details(self):
+        """Test that supplied details are stored without copying."""
+        details = {'key': 'value'}
+        assert BaseApplicationError("Test error", details).details is details
+
     def test_configuration_error(self):
         """Test ConfigurationError inherits from BaseApplicationError."""
         error = ConfigurationError("Config error")
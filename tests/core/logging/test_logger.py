@@ -4,7 +4,15 @@ Unit tests for Logger.
 
 import pytest
 import logging
-from src.core.logging.logger import Logger
+import os
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler
+from src.core.config import config_manager
+from src.core.logging.logger import (
+    FastFormatter,
+    FastRotatingFileHandler,
+    Logger,
+)
 
 
 @pytest.mark.unit
@@ -32,3 +40,173 @@ class TestLogger:
         
         # Logger should have handlers configured
         assert len(logging.getLogger(logger.name).handlers) > 0
+
+    def test_file_output_goes_through_shared_queue(self):
+        """Test that loggers feed one background file writer."""
+        logger1 = Logger.get_logger("queue_module1")
+        logger2 = Logger.get_logger("queue_module2")
+
+        queues = [
+            handler.queue
+            for logger in (logger1, logger2)
+            for handler in logger.handlers
+            if isinstance(handler, QueueHandler)
+        ]
+        if not queues:
+            pytest.skip("File logging disabled in this environment")
+
+        assert len(queues) == 2
+        assert queues[0] is queues[1]
+        assert Logger._file_listener is not None
+
+    def test_logging_config_is_cached(self):
+        """Test that logging settings are read once and can be invalidated."""
+        cfg = Logger._load_cfg()
+        assert Logger._load_cfg() is cfg
+
+        Logger.invalidate_cfg()
+        reloaded = Logger._load_cfg()
+        assert reloaded is not cfg
+        assert reloaded == cfg
+
+    def test_reload_applies_new_level(self, monkeypatch):
+        """Test that a configuration reload reaches loggers already configured."""
+        logger = Logger.get_logger("reload_module")
+        level = logger.level
+        overrides = {'logging.level': 'ERROR'}
+        original_get = config_manager.get
+        monkeypatch.setattr(
+            config_manager, 'get',
+            lambda key, default=None: overrides.get(key, original_get(key, default))
+        )
+
+        config_manager.reload()
+        assert logger.level == logging.ERROR
+
+        monkeypatch.undo()
+        config_manager.reload()
+        assert logger.level == level
+
+    def test_concurrent_get_logger_configures_once(self):
+        """Test that racing callers do not attach duplicate handlers."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            loggers = list(executor.map(
+                Logger.get_logger, ["concurrent_module"] * 32
+            ))
+
+        assert all(logger is loggers[0] for logger in loggers)
+        handler_types = [type(h) for h in loggers[0].handlers]
+        assert len(handler_types) == len(set(handler_types))
+
+    def test_loggers_share_handler_instances(self):
+        """Test that every logger reuses the same process-wide handlers."""
+        logger1 = Logger.get_logger("shared_module1")
+        logger2 = Logger.get_logger("shared_module2")
+
+        assert logger1.handlers == logger2.handlers
+        assert all(
+            h1 is h2 for h1, h2 in zip(logger1.handlers, logger2.handlers)
+        )
+
+    def test_null_logger_discards_records(self):
+        """Test that the null logger is disabled and never propagates."""
+        logger = Logger.get_null_logger("silent_module")
+
+        assert logger.disabled
+        assert not logger.propagate
+        assert not logger.isEnabledFor(logging.CRITICAL)
+
+    def test_class_logger_resolved_once_per_class(self):
+        """Test that class loggers are named after the class and memoized."""
+        class SampleComponent:
+            pass
+
+        logger = Logger.get_class_logger(SampleComponent)
+
+        assert logger is Logger.get_logger("SampleComponent")
+        assert Logger.get_class_logger(SampleComponent) is logger
+
+
+@pytest.mark.unit
+class TestFastFormatter:
+    """Test suite for FastFormatter class."""
+
+    def test_matches_stock_formatter(self):
+        """Test that output is identical to logging.Formatter."""
+        fmt = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        record = logging.LogRecord(
+            "test", logging.WARNING, __file__, 0, "value %s", (42,), None
+        )
+
+        expected = logging.Formatter(fmt).format(record)
+        assert FastFormatter(fmt).format(record) == expected
+
+    def test_format_without_time(self):
+        """Test that asctime is not computed when the format omits it."""
+        record = logging.LogRecord(
+            "test", logging.INFO, __file__, 0, "plain", None, None
+        )
+
+        assert FastFormatter('%(levelname)s: %(message)s').format(record) == "INFO: plain"
+        assert not hasattr(record, 'asctime')
+
+
+@pytest.mark.unit
+class TestFastRotatingFileHandler:
+    """Test suite for FastRotatingFileHandler class."""
+
+    def _record(self, message):
+        """Build an INFO record with the given message."""
+        return logging.LogRecord(
+            "test", logging.INFO, __file__, 0, message, None, None
+        )
+
+    def test_writes_utf8_records(self, tmp_path):
+        """Test that records are appended as UTF-8 lines."""
+        log_path = tmp_path / "app.log"
+        handler = FastRotatingFileHandler(str(log_path))
+        handler.emit(self._record("héllo"))
+        handler.emit(self._record("world"))
+        handler.close()
+
+        assert log_path.read_text(encoding='utf-8') == "héllo\nworld\n"
+
+    def test_rotates_when_size_limit_reached(self, tmp_path):
+        """Test that the file is rotated once it would exceed max bytes."""
+        log_path = tmp_path / "app.log"
+        handler = FastRotatingFileHandler(
+            str(log_path), maxBytes=16, backupCount=1
+        )
+        handler.emit(self._record("first record"))
+        handler.emit(self._record("second record"))
+        handler.close()
+
+        assert log_path.read_text() == "second record\n"
+        assert (tmp_path / "app.log.1").read_text() == "first record\n"
+
+    def test_rotation_sees_other_writers(self, tmp_path):
+        """Test that appends by another writer count towards the limit."""
+        log_path = tmp_path / "app.log"
+        handler = FastRotatingFileHandler(
+            str(log_path), maxBytes=32, backupCount=1
+        )
+        handler.emit(self._record("mine"))
+        with open(log_path, 'a') as other:
+            other.write("x" * 24 + "\n")
+        handler.emit(self._record("after"))
+        handler.close()
+
+        assert log_path.read_text() == "after\n"
+        assert (tmp_path / "app.log.1").read_text() == "mine\n" + "x" * 24 + "\n"
+
+    def test_partial_writes_completed(self, tmp_path, monkeypatch):
+        """Test that a short raw write is retried until the record is out."""
+        log_path = tmp_path / "app.log"
+        handler = FastRotatingFileHandler(str(log_path))
+        real_write = os.write
+        monkeypatch.setattr(os, 'write', lambda fd, data: real_write(fd, data[:3]))
+        handler.emit(self._record("a longer record"))
+        monkeypatch.undo()
+        handler.close()
+
+        assert log_path.read_text() == "a longer record\n"
@@ -45,6 +45,13 @@ class TestCodeReviewPrompt:
         assert 'security' in messages[0]['content']
         assert 'print("hello")' in messages[1]['content']
 
+    def test_get_messages_keeps_braces_in_code(self, prompt):
+        """Test that braces in the code are not treated as placeholders."""
+        messages = prompt.get_messages({'code': 'x = {key}'})
+
+        assert 'unknown' in messages[0]['content']
+        assert '```unknown\nx = {key}\n```' in messages[1]['content']
+
     def test_missing_required_argument_raises_error(self, prompt):
         """Test that missing required argument raises error."""
         with pytest.raises(ValidationError) as exc_info:
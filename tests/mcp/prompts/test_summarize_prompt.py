@@ -3,6 +3,7 @@ Unit tests for SummarizePrompt.
 """
 
 import pytest
+from src.mcp.prompts.base_prompt import BasePrompt
 from src.mcp.prompts.summarize_prompt import SummarizePrompt
 from src.core.errors.exceptions import ValidationError
 
@@ -63,3 +64,11 @@ class TestSummarizePrompt:
 
         assert isinstance(prompt_dict, dict)
         assert prompt_dict['name'] == 'summarize'
+
+    def test_base_get_messages_not_implemented(self):
+        """Test that prompts without get_messages fail when rendered."""
+        class IncompletePrompt(BasePrompt):
+            pass
+
+        with pytest.raises(NotImplementedError):
+            IncompletePrompt("incomplete", "No messages").get_messages()
@@ -2,7 +2,11 @@
 Unit tests for ConfigResource.
 """
 
+from collections.abc import Mapping
+
 import pytest
+from src.core.config import config_manager
+from src.mcp.resources.base_resource import BaseResource
 from src.mcp.resources.config_resource import ConfigResource
 
 
@@ -26,6 +30,13 @@ class TestConfigResource:
         """Test that config resource is static."""
         assert resource.is_dynamic() is False
 
+    def test_subclass_without_is_dynamic_rejected(self):
+        """Test that resources must declare IS_DYNAMIC."""
+        with pytest.raises(TypeError):
+            class UndeclaredResource(BaseResource):
+                def read(self):
+                    return {}
+
     def test_read_resource(self, resource):
         """Test reading config resource."""
         content = resource.read()
@@ -41,10 +52,37 @@ class TestConfigResource:
         content = resource.read()
 
         config_data = content['content']
-        assert isinstance(config_data, dict)
+        assert isinstance(config_data, Mapping)
         # Should contain app configuration
         assert 'app' in config_data or 'logging' in config_data
 
+    def test_read_serves_read_only_config_view(self, resource):
+        """Test that reads share the config view without copying it."""
+        first = resource.read()
+        second = resource.read()
+
+        assert first is not second
+        assert first['content'] is resource.config.get_all()
+        assert second['content'] is first['content']
+        with pytest.raises(TypeError):
+            first['content']['injected'] = True
+
+    def test_read_follows_config_reload(self, resource, monkeypatch):
+        """Test that a configuration reload is reflected in the next read."""
+        resource.read()
+        original_load = config_manager._load_config
+        monkeypatch.setattr(
+            config_manager, '_load_config',
+            lambda: {**original_load(), 'reloaded': {'value': 1}}
+        )
+
+        config_manager.reload()
+        assert resource.read()['content']['reloaded'] == {'value': 1}
+
+        monkeypatch.undo()
+        config_manager.reload()
+        assert 'reloaded' not in resource.read()['content']
+
     def test_get_metadata(self, resource):
         """Test getting resource metadata."""
         metadata = resource.get_metadata()
@@ -3,6 +3,8 @@ Unit tests for StatusResource.
 """
 
 import pytest
+from datetime import datetime
+from src.mcp.resources import status_resource
 from src.mcp.resources.status_resource import StatusResource
 
 
@@ -60,6 +62,35 @@ class TestStatusResource:
 
         assert count1 < count2 < count3
 
+    def test_uptime_is_read_count_proxy(self, resource):
+        """Test that uptime keeps its read-count based value."""
+        first = resource.read()['content']
+        second = resource.read()['content']
+
+        assert first['uptime_seconds'] == first['read_count'] * 10
+        assert second['uptime_seconds'] == second['read_count'] * 10
+
+    def test_monotonic_uptime_flag(self):
+        """Test that monotonic uptime counts seconds since creation."""
+        resource = StatusResource(monotonic_uptime=True)
+        resource._start -= 42
+
+        assert resource.read()['content']['uptime_seconds'] >= 42
+
+    def test_timestamp_matches_isoformat(self, resource, monkeypatch):
+        """Test that each read is stamped with the full current time."""
+        second = int(datetime(2024, 1, 2, 3, 4, 5).timestamp())
+        now_ns = [second * 1_000_000_000 + 678_901_000]
+        monkeypatch.setattr(status_resource.time, 'time_ns', lambda: now_ns[0])
+
+        assert resource.read()['content']['timestamp'] == '2024-01-02T03:04:05.678901'
+
+        now_ns[0] += 1_000
+        assert resource.read()['content']['timestamp'] == '2024-01-02T03:04:05.678902'
+
+        now_ns[0] = (second + 1) * 1_000_000_000
+        assert resource.read()['content']['timestamp'] == '2024-01-02T03:04:06'
+
     def test_get_metadata(self, resource):
         """Test getting resource metadata."""
         metadata = resource.get_metadata()
@@ -68,6 +99,13 @@ class TestStatusResource:
         assert metadata['name'] == "System Status"
         assert metadata['isDynamic'] is True
 
+    def test_get_metadata_returns_independent_copies(self, resource):
+        """Test that cached metadata cannot be mutated through a caller's copy."""
+        metadata = resource.get_metadata()
+        metadata['name'] = "Changed"
+
+        assert resource.get_metadata()['name'] == "System Status"
+
     def test_to_dict_includes_metadata(self):
         """Test to_dict includes all metadata."""
         resource = StatusResource()
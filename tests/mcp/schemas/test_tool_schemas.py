@@ -0,0 +1,151 @@
+"""
+Unit tests for ToolSchema.
+"""
+
+import pytest
+from src.mcp.schemas.tool_schemas import ToolSchema
+
+
+@pytest.mark.unit
+class TestToolSchema:
+    """Test suite for ToolSchema class."""
+
+    @pytest.fixture
+    def schema(self):
+        """Create a schema with typed and required fields."""
+        return ToolSchema(
+            name='sample',
+            description='Sample tool',
+            input_schema={
+                'type': 'object',
+                'properties': {
+                    'text': {'type': 'string'},
+                    'count': {'type': 'integer'},
+                    'ratio': {'type': 'number'},
+                    'flag': {'type': 'boolean'},
+                    'options': {'type': 'object'},
+                    'items': {'type': 'array'},
+                    'anything': {'description': 'Untyped field'}
+                },
+                'required': ['text']
+            },
+            output_schema={'type': 'object'}
+        )
+
+    def test_valid_input(self, schema):
+        """Test that matching parameters pass validation."""
+        assert schema.validate_input({
+            'text': 'hello',
+            'count': 3,
+            'ratio': 0.5,
+            'flag': True,
+            'options': {},
+            'items': [],
+            'anything': object()
+        })
+
+    def test_missing_required_field(self, schema):
+        """Test that a missing required field fails validation."""
+        assert not schema.validate_input({'count': 3})
+
+    def test_wrong_type(self, schema):
+        """Test that a mistyped field fails validation."""
+        assert not schema.validate_input({'text': 'hello', 'count': '3'})
+        assert not schema.validate_input({'text': None})
+
+    def test_number_accepts_int_and_float(self, schema):
+        """Test that 'number' accepts both integers and floats."""
+        assert schema.validate_input({'text': 'a', 'ratio': 1})
+        assert schema.validate_input({'text': 'a', 'ratio': 1.5})
+
+    def test_subclass_instances_accepted(self, schema):
+        """Test that subclasses of the expected type still validate."""
+        class Text(str):
+            pass
+
+        assert schema.validate_input({'text': Text('hello'), 'flag': False})
+        assert ToolSchema._check_type(Text('hello'), 'string')
+        assert ToolSchema._check_type(True, 'integer')
+
+    def test_unknown_fields_ignored(self, schema):
+        """Test that fields outside the schema are not type-checked."""
+        assert schema.validate_input({'text': 'a', 'extra': 42})
+
+    def test_to_dict(self, schema):
+        """Test dictionary representation of the schema."""
+        schema_dict = schema.to_dict()
+
+        assert schema_dict['name'] == 'sample'
+        assert 'inputSchema' in schema_dict
+        assert 'outputSchema' in schema_dict
+
+    def test_to_dict_returns_independent_copies(self, schema):
+        """Test that mutating a returned dict does not affect the schema."""
+        first = schema.to_dict()
+        first['name'] = 'changed'
+
+        second = schema.to_dict()
+        assert second is not first
+        assert second['name'] == 'sample'
+
+    def test_check_type_dispatch(self):
+        """Test type checks for known and unknown schema types."""
+        assert ToolSchema._check_type(1, 'number')
+        assert ToolSchema._check_type(1.5, 'number')
+        assert not ToolSchema._check_type('1', 'number')
+        assert not ToolSchema._check_type({}, 'array')
+        assert ToolSchema._check_type(object(), 'null')
+
+    @pytest.mark.parametrize('json_type', ['string', 'number', 'integer', 'boolean', 'object', 'array'])
+    def test_validator_shares_type_rules_with_check_type(self, json_type):
+        """Test that compiled validation and _check_type apply the same rules."""
+        validate = ToolSchema(
+            name='typed',
+            description='Typed field',
+            input_schema={'type': 'object', 'properties': {'value': {'type': json_type}}},
+            output_schema={}
+        ).validator
+
+        for value in ('a', 1, 1.5, True, {}, [], None):
+            assert validate({'value': value}) is ToolSchema._check_type(value, json_type)
+
+    def test_validator_matches_validate_input(self, schema):
+        """Test that the exposed compiled validator agrees with validate_input."""
+        validate = schema.validator
+        assert validate({'text': 'a'}) is schema.validate_input({'text': 'a'})
+        assert validate({'count': 1}) is False
+
+    def test_to_dict_reflects_later_changes(self, schema):
+        """Test that to_dict reports attributes changed after construction."""
+        schema.name = 'renamed'
+        schema.description = 'Renamed tool'
+        schema_dict = schema.to_dict()
+
+        assert schema_dict['name'] == 'renamed'
+        assert schema_dict['description'] == 'Renamed tool'
+
+    def test_replacing_input_schema_recompiles_validator(self, schema):
+        """Test that a new input schema takes effect in validation."""
+        schema.input_schema = {
+            'type': 'object',
+            'properties': {'count': {'type': 'integer'}},
+            'required': ['count']
+        }
+
+        assert schema.validate_input({'count': 1})
+        assert not schema.validate_input({'text': 'a'})
+        assert schema.validator({'count': 1}) is True
+        assert schema.to_dict()['inputSchema']['required'] == ['count']
+
+    def test_copy_is_independent(self, schema):
+        """Test that a copy matches the original but shares no dicts."""
+        clone = schema.copy()
+
+        assert clone.to_dict() == schema.to_dict()
+        assert clone.validator is schema.validator
+        assert clone.input_schema is not schema.input_schema
+
+        clone.name = 'copied'
+        clone.input_schema['required'].append('extra')
+        assert schema.name != 'copied'
+        assert 'extra' not in schema.input_schema['required']
@@ -0,0 +1,65 @@
+"""
+Unit tests for MCP server factories.
+"""
+
+import pytest
+from src.mcp.factories import (
+    build_default_server,
+    default_prompts,
+    default_resources,
+    default_tools,
+)
+from src.mcp.tools.echo_tool import EchoTool
+from src.mcp.resource_registry import ResourceRegistry
+from src.mcp.prompt_registry import PromptRegistry
+
+
+@pytest.mark.unit
+class TestFactories:
+    """Test suite for the default component factories."""
+
+    @pytest.fixture(autouse=True)
+    def clean_registries(self):
+        """Clear the shared registries around each test."""
+        registries = (ResourceRegistry(), PromptRegistry())
+        for registry in registries:
+            registry.clear()
+        yield
+        for registry in registries:
+            registry.clear()
+
+    def test_default_components_are_cached(self):
+        """Test that repeated calls return the same component tuples."""
+        assert default_tools() is default_tools()
+        assert default_resources() is default_resources()
+        assert default_prompts() is default_prompts()
+
+    def test_build_default_server(self):
+        """Test that the server is initialized with the built-in components."""
+        server = build_default_server()
+
+        assert server.is_initialized
+        assert set(server.list_tools()) == {
+            tool.name for tool in default_tools()
+        }
+        assert len(server.resource_registry) == len(default_resources())
+        assert len(server.prompt_registry) == len(default_prompts())
+
+    def test_build_default_server_with_extra_tools(self):
+        """Test that extra tools are registered next to the built-in ones."""
+        class ExtraTool(EchoTool):
+            def _define_schema(self):
+                schema = super()._define_schema()
+                schema.name = 'extra_echo'
+                return schema
+
+        server = build_default_server(extra_tools=[ExtraTool()])
+
+        assert 'extra_echo' in server.list_tools()
+        assert len(server.list_tools()) == len(default_tools()) + 1
+
+        extra = ExtraTool()
+        assert extra.to_dict()['name'] == extra.name
+        advertised = [tool['name'] for tool in server.get_tools_metadata()]
+        assert advertised.count('echo') == 1
+        assert 'extra_echo' in advertised
@@ -39,6 +39,11 @@ class TestPromptRegistry:
         registry2 = PromptRegistry()
         assert registry1 is registry2
 
+    def test_repeated_construction_skips_init(self):
+        """Test that re-instantiating the singleton does not re-initialize it."""
+        logger = PromptRegistry().logger
+        assert PromptRegistry().logger is logger
+
     def test_register_prompt(self, registry, summarize_prompt):
         """Test registering a prompt."""
         registry.register(summarize_prompt)
@@ -102,14 +107,43 @@ class TestPromptRegistry:
         with pytest.raises(ResourceNotFoundError):
             registry.unregister('nonexistent')
 
+    def test_list_prompts_returns_fresh_lists(self, registry, code_review_prompt, summarize_prompt):
+        """Test that callers can modify listings without affecting the registry."""
+        registry.register(code_review_prompt)
+        first = registry.list_prompts()
+        assert isinstance(first, list)
+        first.append('extra')
+        assert registry.list_prompts() == first[:-1]
+
+        metadata = registry.get_prompts_metadata()
+        assert isinstance(metadata, list)
+        metadata[0]['name'] = 'changed'
+        assert registry.get_prompts_metadata()[0]['name'] != 'changed'
+
+        registry.register(summarize_prompt)
+        assert len(registry.list_prompts()) == 2
+        assert len(registry.get_prompts_metadata()) == 2
+
+    def test_register_many_collects_duplicates(self, registry, code_review_prompt, summarize_prompt):
+        """Test bulk registration reports duplicates without raising."""
+        registry.register(code_review_prompt)
+
+        failures = registry.register_many([code_review_prompt, summarize_prompt])
+
+        assert len(registry) == 2
+        assert len(failures) == 1
+        assert failures[0][0] is code_review_prompt
+        assert isinstance(failures[0][1], ResourceAlreadyExistsError)
+
     def test_clear_registry(self, registry, code_review_prompt, summarize_prompt):
         """Test clearing all prompts from registry."""
         registry.register(code_review_prompt)
         registry.register(summarize_prompt)
         assert len(registry) == 2
 
-        registry.clear()
+        assert registry.clear() == 2
         assert len(registry) == 0
+        assert registry.clear() == 0
 
     def test_contains_operator(self, registry, summarize_prompt):
         """Test the 'in' operator."""
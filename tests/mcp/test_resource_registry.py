@@ -39,6 +39,11 @@ class TestResourceRegistry:
         registry2 = ResourceRegistry()
         assert registry1 is registry2
 
+    def test_repeated_construction_skips_init(self):
+        """Test that re-instantiating the singleton does not re-initialize it."""
+        logger = ResourceRegistry().logger
+        assert ResourceRegistry().logger is logger
+
     def test_register_resource(self, registry, config_resource):
         """Test registering a resource."""
         registry.register(config_resource)
@@ -102,6 +107,34 @@ class TestResourceRegistry:
         with pytest.raises(ResourceNotFoundError):
             registry.unregister('nonexistent://resource')
 
+    def test_list_resources_returns_fresh_lists(self, registry, config_resource, status_resource):
+        """Test that callers can modify listings without affecting the registry."""
+        registry.register(config_resource)
+        first = registry.list_resources()
+        assert isinstance(first, list)
+        first.append('extra')
+        assert registry.list_resources() == first[:-1]
+
+        metadata = registry.get_resources_metadata()
+        assert isinstance(metadata, list)
+        metadata[0]['name'] = 'changed'
+        assert registry.get_resources_metadata()[0]['name'] != 'changed'
+
+        registry.register(status_resource)
+        assert len(registry.list_resources()) == 2
+        assert len(registry.get_resources_metadata()) == 2
+
+    def test_register_many_collects_duplicates(self, registry, config_resource, status_resource):
+        """Test bulk registration reports duplicates without raising."""
+        registry.register(config_resource)
+
+        failures = registry.register_many([config_resource, status_resource])
+
+        assert len(registry) == 2
+        assert len(failures) == 1
+        assert failures[0][0] is config_resource
+        assert isinstance(failures[0][1], ResourceAlreadyExistsError)
+
     def test_clear_registry(self, registry, config_resource, status_resource):
         """Test clearing all resources from registry."""
         registry.register(config_resource)
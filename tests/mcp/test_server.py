@@ -2,6 +2,8 @@
 Unit tests for MCPServer.
 """
 
+import logging
+
 import pytest
 from src.mcp.server import MCPServer
 from src.mcp.tools.calculator_tool import CalculatorTool
@@ -124,6 +126,23 @@ class TestMCPServer:
         assert info['capabilities']['resources'] is True
         assert info['capabilities']['prompts'] is True
 
+    def test_get_info_tracks_state_changes(self, server, calculator_tool, echo_tool):
+        """Test that get_info reflects state and is safe to modify."""
+        server.initialize(tools=[calculator_tool])
+        info = server.get_info()
+        info['tool_count'] = 99
+        info['capabilities']['tools'] = False
+        assert server.get_info()['tool_count'] == 1
+        assert server.get_info()['capabilities']['tools'] is True
+
+        server.register_tool(echo_tool)
+        updated = server.get_info()
+        assert updated is not info
+        assert updated['tool_count'] == 2
+
+        server.shutdown()
+        assert server.get_info()['initialized'] is False
+
     def test_shutdown_server(self, server, calculator_tool, echo_tool):
         """Test shutting down the server."""
         server.initialize(tools=[calculator_tool, echo_tool])
@@ -171,6 +190,29 @@ class TestMCPServer:
         assert 'error' in result
         assert "not initialized" in result['error'].lower()
 
+    def test_operations_refused_after_shutdown(self, server, calculator_tool):
+        """Test that requests are refused again once the server shuts down."""
+        server.initialize(tools=[calculator_tool])
+        assert server.execute_tool('calculator', {
+            'operation': 'add', 'a': 1, 'b': 2
+        })['success'] is True
+
+        server.shutdown()
+        result = server.execute_tool('calculator', {})
+        assert 'not initialized' in result['error'].lower()
+        assert 'not initialized' in server.read_resource('config://app')['error'].lower()
+
+    def test_not_initialized_responses_are_independent(self, server):
+        """Test that modifying one refusal does not leak into later ones."""
+        first = server.execute_tool('calculator', {})
+        first['error'] = 'changed'
+        assert server.execute_tool('echo', {})['error'] == "Server not initialized"
+        assert server.get_prompt_messages('test_prompt')['error'] == "Server not initialized"
+
+        read = server.read_resource('config://app')
+        read['error'] = 'changed'
+        assert server.read_resource('status://system')['error'] == "Server not initialized"
+
     def test_read_resource_with_exception(self, server):
         """Test reading non-existent resource handles exception."""
         server.initialize()
@@ -220,6 +262,22 @@ class TestMCPServer:
         # Server should still be initialized even if tool registration failed
         assert server.is_initialized
 
+    def test_initialize_with_duplicate_tools_warns(self, server, calculator_tool):
+        """Test that duplicate tools at startup are logged as warnings."""
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        server.logger.addHandler(handler)
+        try:
+            server.initialize(tools=[calculator_tool, calculator_tool])
+        finally:
+            server.logger.removeHandler(handler)
+
+        assert server.list_tools() == ['calculator']
+        warnings = [r for r in records if r.levelno == logging.WARNING]
+        assert [r.getMessage() for r in warnings] == ["Tool calculator already registered"]
+        assert not [r for r in records if r.levelno >= logging.ERROR]
+
     def test_initialize_with_invalid_resource(self, server):
         """Test initialization handles resource registration failure gracefully."""
         class FailingResource:
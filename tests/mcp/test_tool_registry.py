@@ -2,6 +2,9 @@
 Unit tests for ToolRegistry.
 """
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from src.mcp.tool_registry import ToolRegistry
 from src.mcp.tools.calculator_tool import CalculatorTool
@@ -19,9 +22,7 @@ class TestToolRegistry:
     @pytest.fixture
     def registry(self):
         """Create a fresh registry for each test."""
-        reg = ToolRegistry()
-        reg.clear()
-        return reg
+        return ToolRegistry()
 
     @pytest.fixture
     def calculator_tool(self):
@@ -33,11 +34,15 @@ class TestToolRegistry:
         """Create an echo tool instance."""
         return EchoTool()
 
-    def test_singleton_pattern(self):
-        """Test that ToolRegistry implements singleton pattern."""
+    def test_instances_are_independent(self, calculator_tool):
+        """Test that each ToolRegistry holds its own tools."""
         registry1 = ToolRegistry()
         registry2 = ToolRegistry()
-        assert registry1 is registry2
+        assert registry1 is not registry2
+
+        registry1.register(calculator_tool)
+        assert 'calculator' in registry1
+        assert 'calculator' not in registry2
 
     def test_register_tool(self, registry, calculator_tool):
         """Test registering a tool."""
@@ -102,6 +107,83 @@ class TestToolRegistry:
         with pytest.raises(ResourceNotFoundError):
             registry.unregister('nonexistent')
 
+    def test_list_tools_returns_fresh_lists(self, registry, calculator_tool, echo_tool):
+        """Test that callers can modify listings without affecting the registry."""
+        registry.register(calculator_tool)
+        first = registry.list_tools()
+        assert isinstance(first, list)
+        first.append('extra')
+        assert registry.list_tools() == first[:-1]
+
+        metadata = registry.get_tools_metadata()
+        assert isinstance(metadata, list)
+        metadata[0]['name'] = 'changed'
+        assert registry.get_tools_metadata()[0]['name'] != 'changed'
+
+        registry.register(echo_tool)
+        assert len(registry.list_tools()) == 2
+        assert len(registry.get_tools_metadata()) == 2
+
+        registry.unregister('echo')
+        assert registry.list_tools() == ['calculator']
+
+    def test_registered_names_are_interned(self, registry, calculator_tool):
+        """Test that registry keys are interned strings."""
+        registry.register(calculator_tool)
+        key = next(iter(registry._tools))
+        assert key is sys.intern(''.join(['calcu', 'lator']))
+
+    def test_writes_publish_new_map(self, registry, calculator_tool, echo_tool):
+        """Test that registration never mutates a previously published map."""
+        registry.register(calculator_tool)
+        snapshot = registry._tools
+
+        registry.register(echo_tool)
+        registry.unregister('calculator')
+        assert list(snapshot) == ['calculator']
+        assert registry.get_tool('echo') is echo_tool
+
+    def test_concurrent_register_and_list(self, registry, calculator_tool, echo_tool):
+        """Test that listings taken during registry churn stay consistent."""
+        def churn():
+            for _ in range(200):
+                registry.register(echo_tool)
+                registry.unregister('echo')
+
+        def read(_):
+            names = registry.list_tools()
+            metadata = registry.get_tools_metadata()
+            return 'calculator' in names and 1 <= len(metadata) <= 2
+
+        registry.register(calculator_tool)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            writer = executor.submit(churn)
+            assert all(executor.map(read, range(500)))
+            writer.result()
+
+        assert registry.list_tools() == ['calculator']
+        assert len(registry.get_tools_metadata()) == 1
+
+    def test_register_many_publishes_once(self, registry, calculator_tool, echo_tool):
+        """Test bulk registration adds valid tools and reports duplicates."""
+        registry.register(calculator_tool)
+        snapshot = registry._tools
+
+        failures = registry.register_many([calculator_tool, echo_tool, echo_tool])
+
+        assert registry.list_tools() == ['calculator', 'echo']
+        assert [tool for tool, _ in failures] == [calculator_tool, echo_tool]
+        assert all(isinstance(e, ResourceAlreadyExistsError) for _, e in failures)
+        assert 'echo' not in snapshot
+
+    def test_register_many_without_changes_keeps_map(self, registry, calculator_tool):
+        """Test that a batch with no new tools leaves the published map alone."""
+        registry.register(calculator_tool)
+        snapshot = registry._tools
+
+        assert len(registry.register_many([calculator_tool])) == 1
+        assert registry._tools is snapshot
+
     def test_clear_registry(self, registry, calculator_tool, echo_tool):
         """Test clearing all tools from registry."""
         registry.register(calculator_tool)
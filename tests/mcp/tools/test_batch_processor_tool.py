@@ -5,9 +5,20 @@ Tests parallel processing with multiprocessing to satisfy
 software submission requirements for CPU-bound operations.
 """
 
+import math
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from multiprocessing import cpu_count
-from src.mcp.tools.batch_processor_tool import BatchProcessorTool, _compute_intensive_operation
+from src.mcp.tools import batch_processor_tool
+from src.mcp.tools.batch_processor_tool import (
+    BatchProcessorTool,
+    _compute_closed_form,
+    _compute_intensive_operation
+)
+
+# Smallest batch that is dispatched to worker processes
+POOLED_ITEMS = list(range(batch_processor_tool._INLINE_MAX_ITEMS + 1))
 
 
 @pytest.mark.unit
@@ -63,7 +74,7 @@ class TestBatchProcessorTool:
 
     def test_custom_workers(self, tool):
         """Test custom number of workers."""
-        items = [1, 2, 3, 4]
+        items = POOLED_ITEMS
         workers = 2
 
         result = tool.execute({
@@ -75,9 +86,68 @@ class TestBatchProcessorTool:
         assert result['result']['workers_used'] == workers
         assert result['result']['count'] == len(items)
 
+    def test_pool_reused_between_calls(self, tool):
+        """Test that worker processes persist across calls of the same size."""
+        tool.execute({'items': POOLED_ITEMS, 'workers': 2})
+        pool = batch_processor_tool._POOL
+        tool.execute({'items': POOLED_ITEMS, 'workers': 2})
+        assert pool is not None
+        assert batch_processor_tool._POOL is pool
+
+    def test_resized_pool_is_joined(self, tool):
+        """Test that replacing the pool reaps the old worker processes."""
+        old_pool = batch_processor_tool._acquire_pool(2)
+        batch_processor_tool._release_pool(old_pool)
+        processes = list(old_pool._pool)
+        new_pool = batch_processor_tool._acquire_pool(3)
+        batch_processor_tool._release_pool(new_pool)
+
+        assert new_pool is not old_pool
+        assert old_pool not in batch_processor_tool._POOL_USERS
+        assert not any(process.is_alive() for process in processes)
+
+    def test_replaced_pool_kept_until_released(self, tool):
+        """Test that a pool in use is shut down only after its batch ends."""
+        busy_pool = batch_processor_tool._acquire_pool(2)
+        new_pool = batch_processor_tool._acquire_pool(3)
+        batch_processor_tool._release_pool(new_pool)
+
+        assert busy_pool.map(_compute_intensive_operation, [2]) == [
+            _compute_intensive_operation(2)
+        ]
+        processes = list(busy_pool._pool)
+        batch_processor_tool._release_pool(busy_pool)
+        assert not any(process.is_alive() for process in processes)
+
+    def test_single_worker_runs_inline(self, tool):
+        """Test that one worker matches the pooled results."""
+        inline = tool.execute({'items': POOLED_ITEMS, 'workers': 1})
+        pooled = tool.execute({'items': POOLED_ITEMS, 'workers': 2})
+        assert inline['result']['results'] == pooled['result']['results']
+        assert inline['result']['workers_used'] == 1
+
+    def test_small_batch_runs_inline(self, tool):
+        """Test that small batches skip the worker processes."""
+        result = tool.execute({'items': [1, 2, 3], 'workers': 2})
+        assert result['success'] is True
+        assert result['result']['workers_used'] == 1
+        assert result['result']['count'] == 3
+
+    def test_concurrent_batches_share_pool(self, tool):
+        """Test that batches from several threads run on the pool together."""
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(
+                lambda _: tool.execute({'items': POOLED_ITEMS, 'workers': 2}),
+                range(3)
+            ))
+
+        assert all(r['result']['workers_used'] == 2 for r in results)
+        assert len({tuple(r['result']['results']) for r in results}) == 1
+        assert batch_processor_tool._POOL_USERS == {}
+
     def test_default_workers(self, tool):
         """Test default worker count equals CPU count."""
-        items = [1, 2, 3]
+        items = POOLED_ITEMS
         result = tool.execute({'items': items})
 
         assert result['success'] is True
@@ -142,6 +212,17 @@ class TestBatchProcessorTool:
         assert result['success'] is False
         assert 'error' in result
 
+    def test_simulate_false_matches_simulation(self, tool):
+        """Test that simulate=False returns the simulated results directly."""
+        items = [1, 2.5, -3, 1000.5]
+        simulated = tool.execute({'items': items})
+        direct = tool.execute({'items': items, 'simulate': False})
+
+        assert direct['success'] is True
+        assert direct['result']['workers_used'] == 1
+        for fast, slow in zip(direct['result']['results'], simulated['result']['results']):
+            assert math.isclose(fast, slow, rel_tol=0, abs_tol=1e-6)
+
     def test_schema_to_dict(self, tool):
         """Test schema conversion to dictionary."""
         schema_dict = tool.to_dict()
@@ -150,6 +231,7 @@ class TestBatchProcessorTool:
         assert 'outputSchema' in schema_dict
         assert 'items' in schema_dict['inputSchema']['properties']
         assert 'workers' in schema_dict['inputSchema']['properties']
+        assert 'simulate' in schema_dict['inputSchema']['properties']
 
 
 @pytest.mark.unit
@@ -181,3 +263,13 @@ class TestComputeIntensiveOperation:
         # Just verify both execute without error
         assert isinstance(result1, (int, float))
         assert isinstance(result2, (int, float))
+
+    def test_closed_form_matches_simulation(self):
+        """Test that the non-simulated path matches the busy loop."""
+        for value in [0, 1, -3, 2.5, 3.14, 999.99, 1000, 1000.5, -1234.5]:
+            assert math.isclose(
+                _compute_closed_form(value),
+                _compute_intensive_operation(value),
+                rel_tol=0,
+                abs_tol=1e-6
+            )
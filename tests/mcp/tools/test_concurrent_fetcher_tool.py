@@ -6,8 +6,14 @@ software submission requirements (complementing CPU-bound multiprocessing).
 """
 
 import pytest
+import threading
 import time
-from src.mcp.tools.concurrent_fetcher_tool import ConcurrentFetcherTool, _simulate_io_operation
+from src.mcp.tools import concurrent_fetcher_tool
+from src.mcp.tools.concurrent_fetcher_tool import (
+    ConcurrentFetcherTool,
+    _build_result,
+    _wait_for_io
+)
 
 
 @pytest.mark.unit
@@ -82,6 +88,21 @@ class TestConcurrentFetcherTool:
         assert result['result']['threads_used'] == max_threads
         assert result['result']['count'] == len(items)
 
+    def test_order_with_fewer_threads_than_items(self, tool):
+        """Test that results keep input order when threads share items."""
+        items = ['a', 'b', 'c', 'd', 'e']
+        result = tool.execute({'items': items, 'max_threads': 2})
+
+        assert result['result']['threads_used'] == 2
+        assert [r['original'] for r in result['result']['results']] == items
+
+    def test_executor_reused_between_calls(self, tool):
+        """Test that worker threads persist across calls."""
+        tool.execute({'items': ['a']})
+        executor = concurrent_fetcher_tool._EXECUTOR
+        tool.execute({'items': ['b']})
+        assert concurrent_fetcher_tool._EXECUTOR is executor
+
     def test_default_max_threads(self, tool):
         """Test default max_threads is 10."""
         items = ['a', 'b', 'c']
@@ -123,6 +144,18 @@ class TestConcurrentFetcherTool:
         # Should only use 2 threads for 2 items
         assert result['result']['threads_used'] == 2
 
+    def test_threads_limited_by_distinct_items(self, tool):
+        """Test that threads_used counts distinct items, not repeats."""
+        result = tool.execute({
+            'items': ['same', 'same', 'same', 'other'],
+            'max_threads': 10
+        })
+
+        assert result['success'] is True
+        assert result['result']['count'] == 4
+        # Only two distinct fetches, so only two threads
+        assert result['result']['threads_used'] == 2
+
     def test_large_batch(self, tool):
         """Test processing a larger batch of items."""
         items = [f'item_{i}' for i in range(20)]
@@ -176,6 +209,24 @@ class TestConcurrentFetcherTool:
             assert 'processed_at' in res
             assert isinstance(res['processed_at'], float)
 
+    def test_duplicate_items_fetched_once(self, tool):
+        """Test that repeated items share one fetch but keep their results."""
+        items = ['a', 'b', 'a', 'a']
+        start_time = time.time()
+        result = tool.execute({'items': items, 'max_threads': 1})
+        elapsed = time.time() - start_time
+
+        assert result['result']['threads_used'] == 1
+        assert [r['original'] for r in result['result']['results']] == items
+        # Two distinct items on one thread: ~200ms rather than ~400ms
+        assert elapsed < 0.35, f"Took {elapsed}s, expected < 0.35s"
+
+    def test_batch_shares_timestamp(self, tool):
+        """Test that one batch records a single completion time."""
+        result = tool.execute({'items': ['a', 'b', 'c'], 'max_threads': 2})
+        stamps = {r['processed_at'] for r in result['result']['results']}
+        assert len(stamps) == 1
+
     def test_schema_to_dict(self, tool):
         """Test schema conversion to dictionary."""
         schema_dict = tool.to_dict()
@@ -185,40 +236,74 @@ class TestConcurrentFetcherTool:
         assert 'items' in schema_dict['inputSchema']['properties']
         assert 'max_threads' in schema_dict['inputSchema']['properties']
 
+    def test_overlapping_calls_report_threads_they_got(self, tool, monkeypatch):
+        """Test that overlapping calls split the shared pool and say so."""
+        started = threading.Semaphore(0)
+        release = threading.Event()
+
+        def blocking_wait(item):
+            started.release()
+            release.wait(5)
+
+        monkeypatch.setattr(concurrent_fetcher_tool, '_wait_for_io', blocking_wait)
+        results = {}
+
+        def run(key, count):
+            results[key] = tool.execute({
+                'items': [f'{key}{i}' for i in range(count)],
+                'max_threads': count
+            })
+
+        first = threading.Thread(target=run, args=('a', 40))
+        first.start()
+        for _ in range(40):
+            assert started.acquire(timeout=5)
+
+        # The first call holds 40 of the 50 workers; the second gets the rest
+        second = threading.Thread(target=run, args=('b', 20))
+        second.start()
+        for _ in range(10):
+            assert started.acquire(timeout=5)
+        release.set()
+        first.join(5)
+        second.join(5)
+
+        assert results['a']['result']['threads_used'] == 40
+        assert results['b']['result']['threads_used'] == 10
+        assert results['b']['result']['count'] == 20
+        assert concurrent_fetcher_tool._reserve_slots(50) == 50
+        concurrent_fetcher_tool._release_slots(50)
 
-@pytest.mark.unit
-class TestSimulateIOOperation:
-    """Test suite for the I/O simulation function."""
 
-    def test_function_exists(self):
-        """Test that simulate function is callable."""
-        assert callable(_simulate_io_operation)
+@pytest.mark.unit
+class TestIOHelpers:
+    """Test suite for the I/O wait and result building helpers."""
 
-    def test_returns_dict(self):
-        """Test that function returns a dictionary."""
-        result = _simulate_io_operation('test')
+    def test_build_result_returns_dict(self):
+        """Test that result building returns a dictionary."""
+        result = _build_result('test', 1.0)
         assert isinstance(result, dict)
 
-    def test_result_structure(self):
+    def test_build_result_structure(self):
         """Test that result has expected keys."""
-        result = _simulate_io_operation('hello')
+        result = _build_result('hello', 1.0)
         assert 'original' in result
         assert 'length' in result
         assert 'uppercase' in result
         assert 'processed_at' in result
 
-    def test_correct_processing(self):
+    def test_build_result_processing(self):
         """Test that processing is correct."""
-        result = _simulate_io_operation('world')
+        result = _build_result('world', 123.5)
         assert result['original'] == 'world'
         assert result['length'] == 5
         assert result['uppercase'] == 'WORLD'
-        assert isinstance(result['processed_at'], float)
+        assert result['processed_at'] == 123.5
 
-    def test_simulates_io_delay(self):
-        """Test that function actually sleeps (simulates I/O)."""
+    def test_wait_for_io_delays(self):
+        """Test that the wait actually sleeps (simulates I/O)."""
         start = time.time()
-        _simulate_io_operation('test')
+        assert _wait_for_io('test') is None
         elapsed = time.time() - start
         # Should take at least 100ms due to sleep(0.1)
         assert elapsed >= 0.09, f"Function took {elapsed}s, expected >= 0.1s"
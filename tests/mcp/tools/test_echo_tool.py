@@ -2,6 +2,10 @@
 Unit tests for EchoTool.
 """
 
+import gc
+import logging
+import weakref
+
 import pytest
 from src.mcp.tools.echo_tool import EchoTool
 
@@ -20,6 +24,10 @@ class TestEchoTool:
         assert tool.name == 'echo'
         assert 'echo' in tool.description.lower()
 
+    def test_tool_has_no_instance_dict(self, tool):
+        """Test that tool attributes are stored in slots."""
+        assert not hasattr(tool, '__dict__')
+
     def test_echo_message(self, tool):
         """Test echoing a simple message."""
         result = tool.execute({'message': 'Hello, World!'})
@@ -45,6 +53,103 @@ class TestEchoTool:
         assert result['success'] is False
         assert 'invalid' in result['error'].lower()
 
+    @pytest.mark.parametrize('params', [None, ['message'], 'message'])
+    def test_non_dict_params_return_error(self, tool, params):
+        """Test that non-dict params give an error result instead of raising."""
+        result = tool.execute(params)
+        assert result['success'] is False
+        assert 'error' in result
+
+    def test_fast_path_matches_full_path(self, tool):
+        """Test that the quiet fast path returns what the full path does."""
+        full = tool.execute({'message': 'hi'})
+        level = tool.logger.level
+        tool.logger.setLevel(logging.WARNING)
+        try:
+            fast = tool.execute({'message': 'hi'})
+            invalid = tool.execute({'message': 42})
+        finally:
+            tool.logger.setLevel(level)
+
+        assert fast == full
+        assert invalid['success'] is False
+
+    def test_schema_defined_once_per_class(self, tool):
+        """Test that _define_schema runs once per class, not per instance."""
+        calls = []
+
+        class RenamedEcho(EchoTool):
+            __slots__ = ()
+
+            def _define_schema(self):
+                calls.append(self)
+                schema = super()._define_schema()
+                schema.name = 'renamed_echo'
+                return schema
+
+        RenamedEcho()
+        RenamedEcho()
+        assert len(calls) == 1
+        assert RenamedEcho().name == 'renamed_echo'
+        assert EchoTool().name == 'echo'
+
+    def test_schema_independent_per_instance(self, tool):
+        """Test that changing one tool's schema leaves other instances alone."""
+        other = EchoTool()
+        assert other.schema is not tool.schema
+        assert other.to_dict() == tool.to_dict()
+
+        other.schema.name = 'changed'
+        other.schema.input_schema['properties']['message']['type'] = 'integer'
+
+        assert tool.name == 'echo'
+        assert EchoTool().name == 'echo'
+        assert tool.schema.input_schema['properties']['message']['type'] == 'string'
+
+    def test_schema_cache_does_not_pin_classes(self):
+        """Test that tool classes defined on the fly can be collected."""
+        class TransientEcho(EchoTool):
+            __slots__ = ()
+
+        TransientEcho()
+        ref = weakref.ref(TransientEcho)
+        del TransientEcho
+        gc.collect()
+
+        assert ref() is None
+
+    def test_execute_uses_replaced_input_schema(self, tool):
+        """Test that validation follows an input schema replaced later."""
+        schema = tool.schema
+        original = schema.input_schema
+        schema.input_schema = {
+            'type': 'object',
+            'properties': {'message': {'type': 'integer'}},
+            'required': ['message']
+        }
+        try:
+            level = tool.logger.level
+            tool.logger.setLevel(logging.INFO)
+            try:
+                assert tool.execute({'message': 'hi'})['success'] is False
+                assert tool.execute({'message': 7})['result'] == {'echo': 7}
+            finally:
+                tool.logger.setLevel(level)
+        finally:
+            schema.input_schema = original
+
+    def test_name_and_description_follow_schema(self, tool):
+        """Test that name and description read through to the schema."""
+        schema = tool.schema
+        name, description = schema.name, schema.description
+        schema.name = 'renamed'
+        schema.description = 'Renamed echo'
+        try:
+            assert tool.name == tool.to_dict()['name'] == 'renamed'
+            assert tool.description == tool.to_dict()['description'] == 'Renamed echo'
+        finally:
+            schema.name, schema.description = name, description
+
     def test_schema_to_dict(self, tool):
         """Test schema conversion to dictionary."""
         schema_dict = tool.to_dict()
@@ -2,6 +2,8 @@
 Unit tests for Resource model.
 """
 
+from datetime import datetime
+
 import pytest
 from src.models.resource import Resource
 from src.core.errors.exceptions import ValidationError
@@ -86,3 +88,37 @@ class TestResource:
         assert data['name'] == 'Test Resource'
         assert 'created_at' in data
         assert 'updated_at' in data
+
+    def test_to_dict_timestamps(self):
+        """Test that serialized timestamps follow update_timestamp."""
+        resource = Resource(resource_id='test-1', name='Test')
+        data = resource.to_dict()
+        assert data['created_at'] == resource.created_at.isoformat()
+        assert data['updated_at'] == data['created_at']
+
+        resource.deactivate()
+        data = resource.to_dict()
+        assert data['updated_at'] == resource.updated_at.isoformat()
+        assert data['created_at'] == resource.created_at.isoformat()
+
+    def test_no_instance_dict(self):
+        """Test that resources use slots instead of a per-instance dict."""
+        resource = Resource(resource_id='test-1', name='Test')
+        assert not hasattr(resource, '__dict__')
+
+    def test_timestamps_are_datetimes(self):
+        """Test that timestamps read back as datetimes and advance on update."""
+        resource = Resource(resource_id='test-1', name='Test')
+        created = resource.created_at
+        assert isinstance(created, datetime)
+        assert resource.updated_at == created
+
+        resource.activate()
+        assert resource.updated_at >= created
+        assert resource.created_at == created
+
+    def test_unhashable_status_raises_validation_error(self):
+        """Test that a non-string status is rejected as a validation error."""
+        with pytest.raises(ValidationError) as exc_info:
+            Resource(resource_id='test-1', name='Test', status=['active'])
+        assert "['active', 'inactive', 'pending']" in str(exc_info.value)
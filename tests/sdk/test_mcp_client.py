@@ -3,6 +3,7 @@ Unit tests for MCP Client SDK.
 """
 
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, MagicMock
 
 from src.sdk.mcp_client import MCPClient
@@ -30,7 +31,7 @@ class TestMCPClient:
     def test_client_initialization(self, client, mock_transport):
         """Test client initialization."""
         assert client.transport is mock_transport
-        assert client._request_id == 0
+        assert client._next_request_id() == "req-1"
 
     def test_connect(self, client, mock_transport):
         """Test connecting to server."""
@@ -60,6 +61,28 @@ class TestMCPClient:
         assert id2 == "req-2"
         assert id3 == "req-3"
 
+    def test_send_request_messages_independent(self, client, mock_transport):
+        """Test that each request is sent as its own message."""
+        mock_transport.receive_message.return_value = {"success": True, "result": {}}
+
+        client._send_request("first.method", {"param": 1})
+        client._send_request("second.method")
+
+        first, second = (c[0][0] for c in mock_transport.send_message.call_args_list)
+        assert first == {"method": "first.method", "id": "req-1", "params": {"param": 1}}
+        assert second == {"method": "second.method", "id": "req-2"}
+
+    def test_request_ids_unique_across_threads(self, client):
+        """Test that concurrent callers never receive the same ID."""
+        def take_ids(n):
+            return [client._next_request_id() for _ in range(n)]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            batches = list(executor.map(take_ids, [500] * 4))
+
+        ids = [request_id for batch in batches for request_id in batch]
+        assert len(set(ids)) == 2000
+
     def test_send_request_success(self, client, mock_transport):
         """Test successful request sending."""
         # Mock successful response
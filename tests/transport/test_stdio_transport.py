@@ -5,6 +5,7 @@ Unit tests for STDIOTransport.
 import pytest
 import json
 from io import StringIO
+from types import MappingProxyType
 
 from src.transport.stdio_transport import STDIOTransport
 
@@ -140,6 +141,17 @@ class TestSTDIOTransport:
         assert parsed["error"] == "test_error_code"
         assert parsed["message"] == "Test error"
 
+    def test_send_message_with_read_only_mapping(self, transport):
+        """Test that read-only views such as configuration are sent as objects."""
+        mock_output = StringIO()
+        transport._output_stream = mock_output
+
+        content = MappingProxyType({"app": {"name": "demo"}})
+        transport.send_message({"result": {"content": content}, "id": 1})
+
+        parsed = json.loads(mock_output.getvalue())
+        assert parsed == {"result": {"content": {"app": {"name": "demo"}}}, "id": 1}
+
     def test_send_message_exception_handling(self, transport):
         """Test send_message handles exceptions gracefully."""
         # Create a mock stream that raises an exception on write